@@ -27,7 +27,10 @@ from hatch_validator.schemas.schema_cache import SchemaCache
 from hatch_validator.schemas.schemas_retriever import (
     SchemaRetriever,
     get_package_schema, 
-    get_registry_schema
+    get_registry_schema,
+    get_package_validator,
+    get_registry_validator,
+    clear_schema_cache
 )
 
 # Registry Access
@@ -57,6 +60,9 @@ __all__ = [
     'SchemaCache',
     'get_package_schema',
     'get_registry_schema',
+    'get_package_validator',
+    'get_registry_validator',
+    'clear_schema_cache',
 
     # Registry Access
     'RegistryService',
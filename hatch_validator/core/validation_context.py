@@ -4,8 +4,10 @@ This module provides the context object used to pass data and state between
 validators and strategies in the validation chain.
 """
 
+import os
+import stat
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 
 
 class ValidationContext:
@@ -20,7 +22,8 @@ class ValidationContext:
     """
     
     def __init__(self, package_dir: Optional[Path] = None, registry_data: Optional[Dict] = None,
-                 allow_local_dependencies: bool = True, force_schema_update: bool = False):
+                 allow_local_dependencies: bool = True, force_schema_update: bool = False,
+                 parallel: bool = False):
         """Initialize validation context.
         
         Args:
@@ -28,12 +31,82 @@ class ValidationContext:
             registry_data (Dict, optional): Registry data for dependency validation. Defaults to None.
             allow_local_dependencies (bool, optional): Whether local dependencies are allowed. Defaults to True.
             force_schema_update (bool, optional): Whether to force schema updates. Defaults to False.
+            parallel (bool, optional): Whether independent validation concerns may run
+                concurrently. Defaults to False.
         """
         self.package_dir = package_dir
         self.registry_data = registry_data
         self.allow_local_dependencies = allow_local_dependencies
         self.force_schema_update = force_schema_update
+        self.parallel = parallel
         self.additional_data = {}
+        self._package_paths: Dict[Tuple[Path, str], Path] = {}
+        self._dir_index: Optional[Tuple[Path, Dict[str, os.DirEntry]]] = None
+    
+    def resolve_package_path(self, relative_path: str) -> Path:
+        """Resolve a path relative to the package directory.
+        
+        Entry point and tool validation resolve the same file names repeatedly,
+        so resolved paths are cached for the lifetime of the context.
+        
+        Args:
+            relative_path (str): Path relative to the package directory
+            
+        Returns:
+            Path: Path of the file inside the package directory
+        """
+        key = (self.package_dir, relative_path)
+        path = self._package_paths.get(key)
+        if path is None:
+            path = self._package_paths[key] = Path(self.package_dir) / relative_path
+        return path
+    
+    def dir_index(self) -> Dict[str, os.DirEntry]:
+        """Get the top-level entries of the package directory.
+        
+        The directory is scanned once per context, and the entries cache their
+        file type, so strategies checking the same files share a single scan.
+        
+        Returns:
+            Dict[str, os.DirEntry]: Entries of the package directory by name, empty
+                if no package directory is set or it cannot be read
+        """
+        if self._dir_index is None or self._dir_index[0] != self.package_dir:
+            entries = {}
+            if self.package_dir:
+                try:
+                    with os.scandir(self.package_dir) as it:
+                        entries = {entry.name: entry for entry in it}
+                except OSError:
+                    pass
+            self._dir_index = (self.package_dir, entries)
+        return self._dir_index[1]
+    
+    def package_file_status(self, relative_path: str) -> Tuple[bool, bool]:
+        """Check whether a path in the package directory exists and is a regular file.
+        
+        Top-level names are answered from the directory index; nested paths,
+        and names the index does not know (e.g. on case-insensitive file
+        systems), fall back to a single stat.
+        
+        Args:
+            relative_path (str): Path relative to the package directory
+            
+        Returns:
+            Tuple[bool, bool]: Whether the path exists and whether it is a regular file
+        """
+        entry = self.dir_index().get(relative_path)
+        if entry is not None:
+            try:
+                return True, entry.is_file()
+            except OSError:
+                pass
+        
+        try:
+            path_stat = os.stat(self.resolve_package_path(relative_path))
+        except OSError:
+            return False, False
+        return True, stat.S_ISREG(path_stat.st_mode)
     
     def set_data(self, key: str, value: Any) -> None:
         """Set additional data in the context.
@@ -4,11 +4,33 @@ This module provides the abstract base class for schema validators that
 implement the Chain of Responsibility pattern.
 """
 
+import threading
+import weakref
 from abc import ABC, abstractmethod
-from typing import Dict, List, Tuple, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Tuple, Optional
 
 from .validation_context import ValidationContext
 
+# Shared pool for running independent validation concerns concurrently,
+# created on first use
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Get the shared validation thread pool, creating it on first use.
+    
+    Returns:
+        ThreadPoolExecutor: Thread pool for validation concerns
+    """
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="hatch-validator")
+    return _executor
+
 
 class Validator(ABC):
     """Abstract base class for validators in the Chain of Responsibility pattern.
@@ -26,8 +48,43 @@ class Validator(ABC):
         Args:
             next_validator (Validator, optional): Next validator in the chain. Defaults to None.
         """
+        self._handlers: Dict[str, Optional['Validator']] = {}
+        # Validators linked to this one, whose handler lookups walk through it
+        self._previous_validators: 'weakref.WeakSet[Validator]' = weakref.WeakSet()
+        self._next_validator: Optional['Validator'] = None
         self.next_validator = next_validator
     
+    @property
+    def next_validator(self) -> Optional['Validator']:
+        """Next validator in the chain, or None at its end."""
+        return self._next_validator
+    
+    @next_validator.setter
+    def next_validator(self, validator: Optional['Validator']) -> None:
+        """Link the next validator, invalidating handler lookups of the chains through this one.
+        
+        Args:
+            validator (Validator, optional): Next validator in the chain
+        """
+        if self._next_validator is not None:
+            self._next_validator._previous_validators.discard(self)
+        self._next_validator = validator
+        if validator is not None:
+            validator._previous_validators.add(self)
+        self._clear_handlers()
+    
+    def _clear_handlers(self) -> None:
+        """Drop the handler lookups of this validator and of the validators linked to it."""
+        pending = [self]
+        cleared = set()
+        while pending:
+            validator = pending.pop()
+            if id(validator) in cleared:
+                continue
+            cleared.add(id(validator))
+            validator._handlers.clear()
+            pending.extend(validator._previous_validators)
+    
     @abstractmethod
     def validate(self, metadata: Dict, context: ValidationContext) -> Tuple[bool, List[str]]:
         """Validate metadata or delegate to next validator in chain.
@@ -67,6 +124,55 @@ class Validator(ABC):
         self.next_validator = validator
         return validator
     
+    def get_handler(self, schema_version: str) -> Optional['Validator']:
+        """Find the validator in this chain that handles the given schema version.
+        
+        The chain is walked at most once per schema version; later lookups are
+        answered from a version-keyed index, so dispatching does not repeat the
+        can_handle checks of every link. The index is dropped whenever a
+        validator of this chain is linked to another one.
+        
+        Args:
+            schema_version (str): Schema version to find a handler for
+            
+        Returns:
+            Optional[Validator]: Validator handling the version, or None if no
+                validator in the chain can handle it
+        """
+        try:
+            return self._handlers[schema_version]
+        except KeyError:
+            pass
+        
+        handler = self
+        while handler is not None and not handler.can_handle(schema_version):
+            handler = handler.next_validator
+        self._handlers[schema_version] = handler
+        return handler
+    
+    def run_checks(self, checks: List[Callable[[Dict, ValidationContext], Tuple[bool, List[str]]]],
+                   metadata: Dict, context: ValidationContext) -> List[Tuple[bool, List[str]]]:
+        """Run independent validation concerns, concurrently if the context allows it.
+        
+        Dependency, entry point and tools validation wait on different I/O
+        (registry lookups, stat calls, file reads), so with `context.parallel`
+        set they are run on a shared thread pool. Otherwise they run in order.
+        
+        Args:
+            checks (List[Callable]): Validation methods taking (metadata, context)
+            metadata (Dict): Package metadata to validate
+            context (ValidationContext): Validation context with resources
+            
+        Returns:
+            List[Tuple[bool, List[str]]]: Result of each check, in the order given
+        """
+        if not getattr(context, "parallel", False) or len(checks) < 2:
+            return [check(metadata, context) for check in checks]
+        
+        executor = _get_executor()
+        futures = [executor.submit(check, metadata, context) for check in checks]
+        return [future.result() for future in futures]
+    
     def validate_schema(self, metadata: Dict, context: ValidationContext) -> Tuple[bool, List[str]]:
         """Validate metadata against schema.
         
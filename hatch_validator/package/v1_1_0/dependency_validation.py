@@ -12,7 +12,7 @@ from hatch_validator.core.validation_strategy import DependencyValidationStrateg
 from hatch_validator.core.validation_context import ValidationContext
 from hatch_validator.utils.hatch_dependency_graph import HatchDependencyGraphBuilder
 from hatch_validator.utils.version_utils import VersionConstraintValidator
-from hatch_validator.registry.registry_service import RegistryService, RegistryError
+from hatch_validator.registry.registry_service import RegistryService, RegistryError, get_registry_service
 from hatch_validator.package.package_service import PackageService
 
 logger = logging.getLogger("hatch.dependency_validation_v1_1_0")
@@ -30,7 +30,6 @@ class DependencyValidation(DependencyValidationStrategy):
     def __init__(self):
         """Initialize the dependency validation strategy."""
         self.version_validator = VersionConstraintValidator()
-        self.registry_service = None
     
     def validate_dependencies(self, metadata: Dict, context: ValidationContext) -> Tuple[bool, List[str]]:
         """Validate dependencies according to v1.1.0 schema using utility modules.
@@ -52,9 +51,15 @@ class DependencyValidation(DependencyValidationStrategy):
         if package_service is None:
             # Create a package service with the provided metadata
             package_service = PackageService(metadata)
-
-        # Store package service for use in helper methods
-        self.package_service = package_service
+        
+        # Use package_service for all metadata access
+        deps = package_service.get_dependencies()
+        hatch_dependencies = deps.get('hatch') or ()
+        python_dependencies = deps.get('python') or ()
+        
+        # Packages without dependencies need neither the registry nor any checks
+        if not hatch_dependencies and not python_dependencies:
+            return True, []
         
         # Initialize registry service from the context if available
         # Get registry data from context
@@ -67,37 +72,30 @@ class DependencyValidation(DependencyValidationStrategy):
             return False, ["No registry data available for dependency validation"]
         
         if registry_service is None:
-            # Create a registry service with the provided data
-            registry_service = RegistryService(registry_data)
-        
-        # Store registry service for use in helper methods
-        self.registry_service = registry_service
+            # Reuse the registry service shared by validations of the same data
+            registry_service = get_registry_service(registry_data)
         
         errors = []
         is_valid = True
         
-        
-        # Use package_service for all metadata access
-        deps = package_service.get_dependencies()
-        hatch_dependencies = deps.get('hatch', [])
-        python_dependencies = deps.get('python', [])
-        
         logger.debug(f"Validating v1.1.0 dependencies - Hatch: {len(hatch_dependencies)}, Python: {len(python_dependencies)}")
         
         # Early check for local dependencies if they're not allowed
         if not context.allow_local_dependencies:
-            local_deps = [dep for dep in hatch_dependencies if package_service.is_local_dependency(dep)]
-            if local_deps:
-                for dep in local_deps:
-                    logger.error(f"Local dependency '{dep.get('name')}' not allowed in this context")
+            local_names = []
+            for dep in hatch_dependencies:
+                if package_service.is_local_dependency(dep):
+                    local_names.append(dep.get('name'))
                     errors.append(f"Local dependency '{dep.get('name')}' not allowed in this context")
+            if local_names:
+                logger.error("Local dependencies not allowed in this context: %s", local_names)
                 is_valid = False
                 return is_valid, errors
         
         # Validate Hatch dependencies
         if hatch_dependencies:
             hatch_valid, hatch_errors = self._validate_hatch_dependencies(
-                hatch_dependencies, context
+                hatch_dependencies, context, package_service, registry_service
             )
             if not hatch_valid:
                 errors.extend(hatch_errors)
@@ -115,12 +113,16 @@ class DependencyValidation(DependencyValidationStrategy):
         return is_valid, errors
     
     def _validate_hatch_dependencies(self, hatch_dependencies: List[Dict], 
-                                   context: ValidationContext) -> Tuple[bool, List[str]]:
+                                   context: ValidationContext,
+                                   package_service: PackageService,
+                                   registry_service: RegistryService) -> Tuple[bool, List[str]]:
         """Validate Hatch package dependencies.
         
         Args:
             hatch_dependencies (List[Dict]): List of Hatch dependency definitions
             context (ValidationContext): Validation context
+            package_service (PackageService): Package service of the validated metadata
+            registry_service (RegistryService): Registry service to look dependencies up in
             
         Returns:
             Tuple[bool, List[str]]: Validation result and errors
@@ -130,7 +132,8 @@ class DependencyValidation(DependencyValidationStrategy):
         
         # Step 1: Validate individual dependencies
         for dep in hatch_dependencies:
-            dep_valid, dep_errors = self._validate_single_hatch_dependency(dep, context)
+            dep_valid, dep_errors = self._validate_single_hatch_dependency(
+                dep, context, package_service, registry_service)
             if not dep_valid:
                 errors.extend(dep_errors)
                 is_valid = False
@@ -138,11 +141,11 @@ class DependencyValidation(DependencyValidationStrategy):
         # Step 2: Build dependency graph and check for cycles
         try:
             hatch_dep_graph_builder = HatchDependencyGraphBuilder(
-                package_service=self.package_service,
-                registry_service=self.registry_service
+                package_service=package_service,
+                registry_service=registry_service
             )
             dependency_graph = hatch_dep_graph_builder.build_dependency_graph(hatch_dependencies, context)
-            has_cycles, cycles = dependency_graph.detect_cycles()
+            has_cycles, cycles = dependency_graph.detect_cycles(max_cycles=1)
             
             if has_cycles:
                 for cycle in cycles:
@@ -159,12 +162,16 @@ class DependencyValidation(DependencyValidationStrategy):
         return is_valid, errors
     
     def _validate_single_hatch_dependency(self, dep: Dict, 
-                                        context: ValidationContext) -> Tuple[bool, List[str]]:
+                                        context: ValidationContext,
+                                        package_service: PackageService,
+                                        registry_service: RegistryService) -> Tuple[bool, List[str]]:
         """Validate a single Hatch dependency.
         
         Args:
             dep (Dict): Dependency definition
             context (ValidationContext): Validation context
+            package_service (PackageService): Package service of the validated metadata
+            registry_service (RegistryService): Registry service to look dependencies up in
             
         Returns:
             Tuple[bool, List[str]]: Validation result and errors
@@ -186,13 +193,13 @@ class DependencyValidation(DependencyValidationStrategy):
                 errors.append(f"Invalid version constraint for '{dep_name}': {constraint_error}")
                 is_valid = False
         
-        if self.package_service.is_local_dependency(dep):
+        if package_service.is_local_dependency(dep):
             local_valid, local_errors = self._validate_local_dependency(dep, context)
             if not local_valid:
                 errors.extend(local_errors)
                 is_valid = False
         else:
-            registry_valid, registry_errors = self._validate_registry_dependency(dep, context)
+            registry_valid, registry_errors = self._validate_registry_dependency(dep, context, registry_service)
             if not registry_valid:
                 errors.extend(registry_errors)
                 is_valid = False
@@ -248,12 +255,14 @@ class DependencyValidation(DependencyValidationStrategy):
         return is_valid, errors
     
     def _validate_registry_dependency(self, dep: Dict, 
-                                    context: ValidationContext) -> Tuple[bool, List[str]]:
+                                    context: ValidationContext,
+                                    registry_service: RegistryService) -> Tuple[bool, List[str]]:
         """Validate a registry dependency.
         
         Args:
             dep (Dict): Registry dependency definition
             context (ValidationContext): Validation context
+            registry_service (RegistryService): Registry service to look dependencies up in
             
         Returns:
             Tuple[bool, List[str]]: Validation result and errors
@@ -265,13 +274,13 @@ class DependencyValidation(DependencyValidationStrategy):
         version_constraint = dep.get('version_constraint')
         
         # Check if package exists in registry
-        exists, error = self.registry_service.validate_package_exists(dep_name)
+        exists, error = registry_service.validate_package_exists(dep_name)
         if not exists:
             errors.append(f"Registry dependency '{dep_name}' not found: {error}")
             is_valid = False
         elif version_constraint:
             # Check if the available version satisfies the constraint
-            version_compatible, version_error = self.registry_service.validate_version_compatibility(
+            version_compatible, version_error = registry_service.validate_version_compatibility(
                 dep_name, version_constraint)
             if not version_compatible:
                 errors.append(f"No version of '{dep_name}' satisfies constraint {version_constraint}: {version_error}")
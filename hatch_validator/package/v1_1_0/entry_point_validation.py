@@ -36,12 +36,12 @@ class EntryPointValidation(EntryPointValidationStrategy):
             logger.error("Package directory not provided for entry point validation")
             return False, ["Package directory not provided for entry point validation"]
         
-        entry_path = context.package_dir / entry_point
-        if not entry_path.exists():
+        exists, is_file = context.package_file_status(entry_point)
+        if not exists:
             logger.error(f"Entry point file '{entry_point}' does not exist")
             return False, [f"Entry point file '{entry_point}' does not exist"]
         
-        if not entry_path.is_file():
+        if not is_file:
             logger.error(f"Entry point '{entry_point}' is not a file")
             return False, [f"Entry point '{entry_point}' is not a file"]
         
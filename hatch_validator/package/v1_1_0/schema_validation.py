@@ -2,7 +2,7 @@ import logging
 import jsonschema
 from typing import Dict, List, Tuple
 
-from hatch_validator.schemas.schemas_retriever import get_package_schema
+from hatch_validator.schemas.schemas_retriever import get_package_validator, SCHEMA_EVALUATION_ERRORS
 from hatch_validator.core.validation_strategy import SchemaValidationStrategy
 from hatch_validator.core.validation_context import ValidationContext
 from hatch_validator.package.package_service import PackageService
@@ -39,18 +39,20 @@ class SchemaValidation(SchemaValidationStrategy):
             if package_service is None:
                 package_service = PackageService(metadata)
             schema_version = package_service.get_field("package_schema_version")
-            schema = get_package_schema(version=schema_version, force_update=context.force_schema_update)
-            if not schema:
+            validator = get_package_validator(version=schema_version, force_update=context.force_schema_update)
+            if validator is None:
                 logger.error(f"Failed to load package schema version {schema_version}")
                 return False, [f"Failed to load package schema version {schema_version}"]
 
-            # Validate against schema
-            jsonschema.validate(instance=metadata, schema=schema)
+            # Validate against schema, only collecting errors when the
+            # pass/fail check fails
+            if not validator.is_valid(metadata):
+                raise jsonschema.exceptions.best_match(validator.iter_errors(metadata))
             return True, []
             
         except jsonschema.exceptions.ValidationError as e:
             logger.error(f"Schema validation error: {e.message}")
             return False, [f"Schema validation error: {e.message}"]
-        except Exception as e:
+        except SCHEMA_EVALUATION_ERRORS as e:
             logger.error(f"Error during schema validation: {str(e)}")
             return False, [f"Error during schema validation: {str(e)}"]
\ No newline at end of file
@@ -40,40 +40,43 @@ class ToolsValidation(ToolsValidationStrategy):
         errors = []
         all_exist = True
         
-        # Parse the entry point file to get function names
+        # Parse the entry point file to get function names. The raw bytes are
+        # handed to ast.parse, which decodes them itself.
+        module_path = context.resolve_package_path(entry_point)
         try:
-            module_path = context.package_dir / entry_point
-            with open(module_path, 'r', encoding='utf-8') as file:
-                try:
-                    tree = ast.parse(file.read(), filename=str(module_path))
-                    
-                    # Get all function names defined in the file
-                    function_names = [node.name for node in ast.walk(tree) 
-                                    if isinstance(node, ast.FunctionDef)]
-                    
-                    logger.debug(f"Found functions in {entry_point}: {function_names}")
-                    
-                    # Check for each tool
-                    for tool in tools:
-                        tool_name = tool.get('name')
-                        if not tool_name:
-                            logger.error(f"Tool metadata missing name: {tool}")
-                            errors.append("Tool missing name in metadata")
-                            all_exist = False
-                            continue
-                        
-                        # Check if the tool function is defined in the file
-                        if tool_name not in function_names:
-                            logger.error(f"Tool '{tool_name}' not found in entry point")
-                            errors.append(f"Tool '{tool_name}' not found in entry point")
-                            all_exist = False
-                    
-                except SyntaxError as e:
-                    logger.error(f"Syntax error in {entry_point}: {e}")
-                    return False, [f"Syntax error in {entry_point}: {e}"]
-                    
-        except Exception as e:
+            source = module_path.read_bytes()
+        except OSError as e:
             logger.error(f"Error validating tools: {str(e)}")
             return False, [f"Error validating tools: {str(e)}"]
+        
+        try:
+            tree = ast.parse(source, filename=str(module_path))
+        except SyntaxError as e:
+            logger.error(f"Syntax error in {entry_point}: {e}")
+            return False, [f"Syntax error in {entry_point}: {e}"]
+        except ValueError as e:
+            logger.error(f"Error validating tools: {str(e)}")
+            return False, [f"Error validating tools: {str(e)}"]
+        
+        # Get all function names defined in the file
+        function_names = [node.name for node in ast.walk(tree) 
+                          if isinstance(node, ast.FunctionDef)]
+        
+        logger.debug(f"Found functions in {entry_point}: {function_names}")
+        
+        # Check for each tool
+        for tool in tools:
+            tool_name = tool.get('name')
+            if not tool_name:
+                logger.error(f"Tool metadata missing name: {tool}")
+                errors.append("Tool missing name in metadata")
+                all_exist = False
+                continue
+            
+            # Check if the tool function is defined in the file
+            if tool_name not in function_names:
+                logger.error(f"Tool '{tool_name}' not found in entry point")
+                errors.append(f"Tool '{tool_name}' not found in entry point")
+                all_exist = False
             
         return all_exist, errors
\ No newline at end of file
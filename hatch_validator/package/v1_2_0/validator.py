@@ -66,8 +66,9 @@ class Validator(ValidatorBase):
         
         # Check if we can handle this version
         if not self.can_handle(schema_version):
-            if self.next_validator:
-                return self.next_validator.validate(metadata, context)
+            handler = self.get_handler(schema_version)
+            if handler:
+                return handler.validate(metadata, context)
             return False, [f"Unsupported schema version: {schema_version}"]
         
         logger.info(f"Validating package metadata using v1.2.0 validator")
@@ -83,15 +84,20 @@ class Validator(ValidatorBase):
             # If schema validation fails, don't continue with other validations
             return is_valid, all_errors
         
-        # 2. Validate dependencies (major change in v1.2.0)
-        deps_valid, deps_errors = self.validate_dependencies(metadata, context)
+        # 2. Validate dependencies (major change in v1.2.0) and 3. entry point
+        # (if package directory is provided), which are independent of each other
+        checks = [self.validate_dependencies]
+        if context.package_dir:
+            checks.append(self.validate_entry_point)
+        results = self.run_checks(checks, metadata, context)
+        
+        deps_valid, deps_errors = results[0]
         if not deps_valid:
             all_errors.extend(deps_errors)
             is_valid = False
         
-        # 3. Validate entry point (if package directory is provided)
         if context.package_dir:
-            entry_valid, entry_errors = self.validate_entry_point(metadata, context)
+            entry_valid, entry_errors = results[1]
             if not entry_valid:
                 all_errors.extend(entry_errors)
                 is_valid = False
@@ -97,14 +97,13 @@ class EntryPointValidation(EntryPointValidationStrategy):
             logger.error(error_msg)
             return False, [error_msg]
         
-        file_path = context.package_dir / filename
-        
-        if not file_path.exists():
+        exists, is_file = context.package_file_status(filename)
+        if not exists:
             error_msg = f"{file_type} file '{filename}' does not exist"
             logger.error(error_msg)
             return False, [error_msg]
         
-        if not file_path.is_file():
+        if not is_file:
             error_msg = f"{file_type} '{filename}' is not a file"
             logger.error(error_msg)
             return False, [error_msg]
@@ -130,12 +129,9 @@ class EntryPointValidation(EntryPointValidationStrategy):
             Tuple[bool, List[str]]: Validation result and errors
         """
         try:
-            wrapper_path = context.package_dir / hatch_wrapper
-            with open(wrapper_path, 'r', encoding='utf-8') as f:
-                source_code = f.read()
-            
-            # Parse the wrapper file
-            tree = ast.parse(source_code)
+            wrapper_path = context.resolve_package_path(hatch_wrapper)
+            # Parse the wrapper file; ast.parse decodes the raw bytes itself
+            tree = ast.parse(wrapper_path.read_bytes(), filename=str(wrapper_path))
             
             # Expected import: from mcp_server import mcp (without .py extension)
             expected_module = mcp_server.replace('.py', '')
@@ -164,7 +160,7 @@ class EntryPointValidation(EntryPointValidationStrategy):
             error_msg = f"HatchMCP wrapper file '{hatch_wrapper}' not found"
             logger.error(error_msg)
             return False, [error_msg]
-        except Exception as e:
+        except (OSError, ValueError) as e:
             error_msg = f"Error validating import relationship: {str(e)}"
             logger.error(error_msg)
             return False, [error_msg]
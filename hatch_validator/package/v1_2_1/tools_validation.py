@@ -95,16 +95,14 @@ class ToolsValidation(ToolsValidationStrategy):
             Tuple[Set[str], List[str]]: Set of tool names and list of errors
         """
         try:
-            file_path = context.package_dir / server_file
-            if not file_path.exists():
+            file_path = context.resolve_package_path(server_file)
+            if not context.package_file_status(server_file)[0]:
                 error_msg = f"FastMCP server file '{server_file}' not found"
                 logger.error(error_msg)
                 return set(), [error_msg]
             
-            with open(file_path, 'r', encoding='utf-8') as f:
-                source_code = f.read()
-            
-            tree = ast.parse(source_code)
+            # ast.parse decodes the raw bytes itself
+            tree = ast.parse(file_path.read_bytes(), filename=str(file_path))
             tool_names = set()
             
             for node in ast.walk(tree):
@@ -127,7 +125,7 @@ class ToolsValidation(ToolsValidationStrategy):
             error_msg = f"FastMCP server file '{server_file}' not found"
             logger.error(error_msg)
             return set(), [error_msg]
-        except Exception as e:
+        except (OSError, ValueError) as e:
             error_msg = f"Error parsing FastMCP server '{server_file}': {str(e)}"
             logger.error(error_msg)
             return set(), [error_msg]
@@ -71,8 +71,9 @@ class Validator(ValidatorBase):
         
         # Check if we can handle this version
         if not self.can_handle(schema_version):
-            if self.next_validator:
-                return self.next_validator.validate(metadata, context)
+            handler = self.get_handler(schema_version)
+            if handler:
+                return handler.validate(metadata, context)
             return False, [f"Unsupported schema version: {schema_version}"]
         
         logger.info(f"Validating package metadata using v1.2.1 validator")
@@ -89,19 +90,21 @@ class Validator(ValidatorBase):
             return is_valid, all_errors
         
         # 2. Validate dependencies (delegate to v1.2.0 - unchanged)
-        deps_valid, deps_errors = self.validate_dependencies(metadata, context)
+        # 3. Validate entry point (dual entry point validation)
+        # 4. Validate tools (enhanced tools validation with FastMCP server enforcement)
+        # These concerns are independent of each other
+        (deps_valid, deps_errors), (entry_point_valid, entry_point_errors), (tools_valid, tools_errors) = \
+            self.run_checks([self.validate_dependencies, self.validate_entry_point, self.validate_tools],
+                            metadata, context)
+        
         if not deps_valid:
             all_errors.extend(deps_errors)
             is_valid = False
         
-        # 3. Validate entry point (dual entry point validation)
-        entry_point_valid, entry_point_errors = self.validate_entry_point(metadata, context)
         if not entry_point_valid:
             all_errors.extend(entry_point_errors)
             is_valid = False
         
-        # 4. Validate tools (enhanced tools validation with FastMCP server enforcement)
-        tools_valid, tools_errors = self.validate_tools(metadata, context)
         if not tools_valid:
             all_errors.extend(tools_errors)
             is_valid = False
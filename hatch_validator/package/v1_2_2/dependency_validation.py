@@ -14,7 +14,7 @@ from hatch_validator.core.validation_strategy import DependencyValidationStrateg
 from hatch_validator.core.validation_context import ValidationContext
 from hatch_validator.utils.hatch_dependency_graph import HatchDependencyGraphBuilder
 from hatch_validator.utils.version_utils import VersionConstraintValidator
-from hatch_validator.registry.registry_service import RegistryService, RegistryError
+from hatch_validator.registry.registry_service import RegistryService, RegistryError, get_registry_service
 from hatch_validator.package.package_service import PackageService
 
 logger = logging.getLogger("hatch.dependency_validation_v1_2_2")
@@ -39,7 +39,6 @@ class DependencyValidation(DependencyValidationStrategy):
     def __init__(self):
         """Initialize the dependency validation strategy."""
         self.version_validator = VersionConstraintValidator()
-        self.registry_service: Optional[RegistryService] = None
     
     def validate_dependencies(self, metadata: Dict, context: ValidationContext) -> Tuple[bool, List[str]]:
         """Validate dependencies according to v1.2.2 schema.
@@ -56,6 +55,8 @@ class DependencyValidation(DependencyValidationStrategy):
                 - bool: Whether dependency validation was successful
                 - List[str]: List of dependency validation errors
         """
+        errors = []
+        is_valid = True
         try:
             # Initialize package service from the context if available
             package_service = context.get_data("package_service", None)
@@ -63,8 +64,14 @@ class DependencyValidation(DependencyValidationStrategy):
                 # Create a package service with the provided metadata
                 package_service = PackageService(metadata)
             
-            # Store package service for use in helper methods
-            self.package_service = package_service
+            # Get dependencies from v1.2.2 unified format (same as v1.2.0)
+            dependencies = package_service.get_dependencies()
+            hatch_dependencies = dependencies.get('hatch') or ()
+            python_dependencies = dependencies.get('python') or ()
+            
+            # Packages without dependencies need neither the registry nor any checks
+            if not hatch_dependencies and not python_dependencies:
+                return True, []
             
             # Initialize registry service from the context if available
             # Get registry data from context
@@ -77,24 +84,13 @@ class DependencyValidation(DependencyValidationStrategy):
                 raise ValidationError("No registry data available for dependency validation")
             
             if registry_service is None:
-                # Create a registry service with the provided data
-                registry_service = RegistryService(registry_data)
-            
-            # Store registry service for use in helper methods
-            self.registry_service = registry_service
-            
-            errors = []
-            is_valid = True
-            
-            # Get dependencies from v1.2.2 unified format (same as v1.2.0)
-            dependencies = package_service.get_dependencies()
-            hatch_dependencies = dependencies.get('hatch', [])
-            python_dependencies = dependencies.get('python', [])
+                # Reuse the registry service shared by validations of the same data
+                registry_service = get_registry_service(registry_data)
             
             # Validate Hatch dependencies (unchanged from v1.2.0)
             if hatch_dependencies:
                 hatch_valid, hatch_errors = self._validate_hatch_dependencies(
-                    hatch_dependencies, context
+                    hatch_dependencies, context, package_service, registry_service
                 )
                 if not hatch_valid:
                     errors.extend(hatch_errors)
@@ -191,7 +187,9 @@ class DependencyValidation(DependencyValidationStrategy):
         return is_valid, errors
 
     def _validate_hatch_dependencies(self, hatch_dependencies: List[Dict],
-                                   context: ValidationContext) -> Tuple[bool, List[str]]:
+                                   context: ValidationContext,
+                                   package_service: PackageService,
+                                   registry_service: RegistryService) -> Tuple[bool, List[str]]:
         """Validate Hatch package dependencies.
 
         This method is unchanged from v1.2.0 implementation.
@@ -199,6 +197,8 @@ class DependencyValidation(DependencyValidationStrategy):
         Args:
             hatch_dependencies (List[Dict]): List of Hatch dependency definitions
             context (ValidationContext): Validation context
+            package_service (PackageService): Package service of the validated metadata
+            registry_service (RegistryService): Registry service to look dependencies up in
 
         Returns:
             Tuple[bool, List[str]]: Validation result and errors
@@ -208,7 +208,8 @@ class DependencyValidation(DependencyValidationStrategy):
 
         # Step 1: Validate individual dependencies
         for dep in hatch_dependencies:
-            dep_valid, dep_errors = self._validate_single_hatch_dependency(dep, context)
+            dep_valid, dep_errors = self._validate_single_hatch_dependency(
+                dep, context, package_service, registry_service)
             if not dep_valid:
                 errors.extend(dep_errors)
                 is_valid = False
@@ -216,13 +217,13 @@ class DependencyValidation(DependencyValidationStrategy):
         # Step 2: Build dependency graph and check for cycles
         try:
             hatch_dep_graph_builder = HatchDependencyGraphBuilder(
-                package_service=self.package_service,
-                registry_service=self.registry_service
+                package_service=package_service,
+                registry_service=registry_service
             )
             dependency_graph = hatch_dep_graph_builder.build_dependency_graph(hatch_dependencies, context)
             logger.debug(f"Dependency graph: {json.dumps(dependency_graph.to_dict(), indent=2)}")
 
-            has_cycles, cycles = dependency_graph.detect_cycles()
+            has_cycles, cycles = dependency_graph.detect_cycles(max_cycles=1)
 
             if has_cycles:
                 for cycle in cycles:
@@ -254,7 +255,9 @@ class DependencyValidation(DependencyValidationStrategy):
             return repo, pkg
         return None, dep_name
 
-    def _validate_single_hatch_dependency(self, dep: Dict, context: ValidationContext) -> Tuple[bool, List[str]]:
+    def _validate_single_hatch_dependency(self, dep: Dict, context: ValidationContext,
+                                          package_service: PackageService,
+                                          registry_service: RegistryService) -> Tuple[bool, List[str]]:
         """Validate a single Hatch dependency.
 
         This method is unchanged from v1.2.0 implementation.
@@ -262,6 +265,8 @@ class DependencyValidation(DependencyValidationStrategy):
         Args:
             dep (Dict): Dependency definition
             context (ValidationContext): Validation context
+            package_service (PackageService): Package service of the validated metadata
+            registry_service (RegistryService): Registry service to look dependencies up in
         Returns:
             Tuple[bool, List[str]]: Validation result and errors
         """
@@ -281,7 +286,7 @@ class DependencyValidation(DependencyValidationStrategy):
                 is_valid = False
 
         # Check if this looks like a local path, otherwise treat as remote
-        if self.package_service.is_local_dependency(dep, context.package_dir):
+        if package_service.is_local_dependency(dep, context.package_dir):
             # Local dependency - check if allowed
             if not context.allow_local_dependencies:
                 errors.append(f"Local dependency '{dep_name}' not allowed in this context")
@@ -292,7 +297,7 @@ class DependencyValidation(DependencyValidationStrategy):
                 is_valid = False
         else:
             # Remote dependency - validate through registry
-            registry_valid, registry_errors = self._validate_registry_dependency(dep, context)
+            registry_valid, registry_errors = self._validate_registry_dependency(dep, context, registry_service)
             if not registry_valid:
                 errors.extend(registry_errors)
                 is_valid = False
@@ -335,7 +340,8 @@ class DependencyValidation(DependencyValidationStrategy):
 
         return True, []
 
-    def _validate_registry_dependency(self, dep: Dict, context: ValidationContext) -> Tuple[bool, List[str]]:
+    def _validate_registry_dependency(self, dep: Dict, context: ValidationContext,
+                                      registry_service: RegistryService) -> Tuple[bool, List[str]]:
         """Validate a registry dependency.
 
         This method is unchanged from v1.2.0 implementation.
@@ -343,6 +349,7 @@ class DependencyValidation(DependencyValidationStrategy):
         Args:
             dep (Dict): Registry dependency definition
             context (ValidationContext): Validation context
+            registry_service (RegistryService): Registry service to look dependencies up in
         Returns:
             Tuple[bool, List[str]]: Validation result and errors
         """
@@ -355,22 +362,22 @@ class DependencyValidation(DependencyValidationStrategy):
 
         if repo:
             # Check repo existence
-            if not self.registry_service.repository_exists(repo):
+            if not registry_service.repository_exists(repo):
                 errors.append(f"Repository '{repo}' not found in registry for dependency '{dep_name}'")
                 return False, errors
             # Check package existence in repo
-            if not self.registry_service.package_exists(pkg, repo_name=repo):
+            if not registry_service.package_exists(pkg, repo_name=repo):
                 errors.append(f"Package '{pkg}' not found in repository '{repo}' for dependency '{dep_name}'")
                 return False, errors
         else:
             # No repo prefix, check package in any repo
-            if not self.registry_service.package_exists(pkg):
+            if not registry_service.package_exists(pkg):
                 errors.append(f"Registry dependency '{pkg}' not found in registry for dependency '{dep_name}'")
                 return False, errors
 
         # Check version compatibility if constraint is specified
         if version_constraint:
-            version_compatible, version_error = self.registry_service.validate_version_compatibility(
+            version_compatible, version_error = registry_service.validate_version_compatibility(
                 dep_name, version_constraint)
             if not version_compatible:
                 errors.append(f"No version of '{dep_name}' satisfies constraint {version_constraint}: {version_error}")
@@ -11,7 +11,7 @@ import jsonschema
 
 from hatch_validator.core.validation_strategy import SchemaValidationStrategy
 from hatch_validator.core.validation_context import ValidationContext
-from hatch_validator.schemas.schemas_retriever import get_package_schema
+from hatch_validator.schemas.schemas_retriever import get_package_validator, SCHEMA_EVALUATION_ERRORS
 
 
 # Configure logging
@@ -39,14 +39,16 @@ class SchemaValidation(SchemaValidationStrategy):
         """
         try:
             # Load schema for v1.2.2
-            schema = get_package_schema(version="1.2.2", force_update=context.force_schema_update)
-            if not schema:
+            validator = get_package_validator(version="1.2.2", force_update=context.force_schema_update)
+            if validator is None:
                 error_msg = "Failed to load package schema version 1.2.2"
                 logger.error(error_msg)
                 return False, [error_msg]
 
-            # Validate against schema
-            jsonschema.validate(instance=metadata, schema=schema)
+            # Validate against schema, only collecting errors when the
+            # pass/fail check fails
+            if not validator.is_valid(metadata):
+                raise jsonschema.exceptions.best_match(validator.iter_errors(metadata))
             logger.debug("Package metadata successfully validated against v1.2.2 schema")
             return True, []
 
@@ -56,7 +58,7 @@ class SchemaValidation(SchemaValidationStrategy):
                 error_msg += f" at path: {'.'.join(str(p) for p in e.absolute_path)}"
             logger.error(error_msg)
             return False, [error_msg]
-        except Exception as e:
+        except SCHEMA_EVALUATION_ERRORS as e:
             error_msg = f"Unexpected error during schema validation: {str(e)}"
             logger.error(error_msg)
             return False, [error_msg]
@@ -12,7 +12,7 @@ from typing import Dict, List, Tuple, Any, Optional
 
 from .core.validator_factory import ValidatorFactory
 from .core.validation_context import ValidationContext
-from .schemas.schemas_retriever import get_registry_schema
+from .schemas.schemas_retriever import get_registry_validator
 
 
 class PackageValidationError(Exception):
@@ -93,17 +93,22 @@ class HatchPackageValidator:
                 - bool: Whether validation was successful
                 - List[str]: List of validation errors
         """
-        # Load schema using the schema retriever
-        schema = get_registry_schema(version=self.version, force_update=self.force_schema_update)
-        if not schema:
+        import jsonschema
+        
+        # Load the compiled schema validator using the schema retriever
+        try:
+            validator = get_registry_validator(version=self.version, force_update=self.force_schema_update)
+        except jsonschema.exceptions.SchemaError as e:
+            return False, [f"Error during registry validation: {str(e)}"]
+        if validator is None:
             error_msg = f"Failed to load registry schema version {self.version}"
             self.logger.error(error_msg)
             return False, [error_msg]
         
         # Validate against schema
         try:
-            import jsonschema
-            jsonschema.validate(instance=metadata, schema=schema)
+            if not validator.is_valid(metadata):
+                raise jsonschema.exceptions.best_match(validator.iter_errors(metadata))
             return True, []
         except jsonschema.exceptions.ValidationError as e:
             return False, [f"Registry validation error: {e.message}"]
@@ -13,6 +13,8 @@ class RegistryAccessorBase(ABC):
     registry schema versions.
     """
     
+    __slots__ = ("_successor",)
+    
     def __init__(self, successor: Optional['RegistryAccessorBase'] = None):
         """Initialize the registry accessor.
         
@@ -200,6 +202,14 @@ class RegistryAccessorBase(ABC):
         """
         pass
 
+    def clear_cache(self) -> None:
+        """Forget any lookups cached from previously queried registry data.
+        
+        Accessors caching lookups override this. It only needs to be called
+        after the queried registry data was changed in place.
+        """
+        pass
+
     def handle_request(self, registry_data: Dict[str, Any]) -> Optional['RegistryAccessorBase']:
         """Handle the request using chain of responsibility pattern.
         
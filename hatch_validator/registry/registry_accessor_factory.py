@@ -6,6 +6,7 @@ registry accessor chain based on the target schema version.
 
 from typing import Optional, List, Dict, Type
 import logging
+import threading
 
 from .registry_accessor_base import RegistryAccessorBase
 
@@ -24,6 +25,9 @@ class RegistryAccessorFactory:
     # Registry of available accessor versions (newest to oldest)
     _accessor_registry: Dict[str, Type[RegistryAccessorBase]] = {}
     _version_order: List[str] = []
+    # Accessor class found by the chain for each registry schema version, None if unsupported
+    _accessor_by_schema_version: Dict[str, Optional[Type[RegistryAccessorBase]]] = {}
+    _accessor_by_schema_version_lock = threading.RLock()
     
     @classmethod
     def register_accessor(cls, version: str, accessor_class: Type[RegistryAccessorBase]) -> None:
@@ -33,7 +37,10 @@ class RegistryAccessorFactory:
             version (str): Schema version string (e.g., '1.1.0').
             accessor_class (Type[RegistryAccessorBase]): Accessor class to register.
         """
-        cls._accessor_registry[version] = accessor_class
+        with cls._accessor_by_schema_version_lock:
+            cls._accessor_registry[version] = accessor_class
+            # A new accessor may handle versions previously resolved to another one
+            cls._accessor_by_schema_version.clear()
         
         # Maintain version order (newest first)
         if version not in cls._version_order:
@@ -118,11 +125,24 @@ class RegistryAccessorFactory:
     def create_accessor_for_data(cls, registry_data: Dict) -> Optional[RegistryAccessorBase]:
         """Create an accessor that can handle the given registry data.
         
+        Accessors are selected by the registry schema version, so the chain is
+        only walked the first time a schema version is seen. Every call returns
+        a new, unlinked instance of the accessor class found in the chain, as
+        accessors keep lookups cached from the data they serve.
+        
         Args:
             registry_data (Dict): Registry data to find an accessor for.
             
         Returns:
             Optional[RegistryAccessorBase]: Accessor that can handle the data, or None.
         """
-        chain = cls.create_accessor_chain()
-        return chain.handle_request(registry_data)
+        schema_version = registry_data.get('registry_schema_version')
+        with cls._accessor_by_schema_version_lock:
+            if isinstance(schema_version, str) and schema_version in cls._accessor_by_schema_version:
+                accessor_class = cls._accessor_by_schema_version[schema_version]
+            else:
+                handler = cls.create_accessor_chain().handle_request(registry_data)
+                accessor_class = type(handler) if handler is not None else None
+                if isinstance(schema_version, str):
+                    cls._accessor_by_schema_version[schema_version] = accessor_class
+        return accessor_class() if accessor_class is not None else None
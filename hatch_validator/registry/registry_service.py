@@ -4,7 +4,10 @@ Provides a high-level interface for working with package registries, including
 validation of package dependencies against registry data.
 """
 
+import json
 import logging
+import threading
+import weakref
 from packaging import specifiers
 from typing import Optional, Dict, List, Any, Tuple
 
@@ -14,6 +17,11 @@ from hatch_validator.utils.version_utils import VersionConstraintValidator, Vers
 
 logger = logging.getLogger("hatch.registry_service")
 
+# Services shared between validations, keyed by the identity of their registry
+# data. Entries disappear once no validation strategy holds the service.
+_service_cache: "weakref.WeakValueDictionary[int, RegistryService]" = weakref.WeakValueDictionary()
+_service_cache_lock = threading.Lock()
+
 
 class RegistryService:
     """Service for registry operations.
@@ -52,6 +60,15 @@ class RegistryService:
         
         logger.debug(f"Loaded registry data with schema version: {self._accessor.get_schema_version(registry_data)}")
     
+    def clear_cache(self) -> None:
+        """Forget the lookups cached from the loaded registry data.
+
+        Call this after changing the loaded registry data in place. Loading
+        other registry data needs no call.
+        """
+        if self._accessor is not None:
+            self._accessor.clear_cache()
+    
     def load_registry_from_file(self, file_path: str) -> None:
         """Load registry data from a JSON file.
 
@@ -62,12 +79,12 @@ class RegistryService:
             RegistryError: If file cannot be read or contains invalid data.
         """
         try:
-            import json
-            with open(file_path, 'r', encoding='utf-8') as f:
-                registry_data = json.load(f)
-            self.load_registry_data(registry_data)
-        except (IOError, json.JSONDecodeError) as e:
+            # Parsing the raw bytes at once is faster than decoding the file as text first
+            with open(file_path, 'rb') as f:
+                registry_data = json.loads(f.read())
+        except (IOError, ValueError) as e:
             raise RegistryError(f"Failed to load registry from file {file_path}: {e}")
+        self.load_registry_data(registry_data)
     
     def is_loaded(self) -> bool:
         """Check if registry data is loaded.
@@ -548,3 +565,31 @@ class RegistryService:
             raise RegistryError("Registry data not loaded")
         
         return self._accessor.get_package_by_repo(self._registry_data, repo_name, package_name)
+
+
+def get_registry_service(registry_data: Dict[str, Any]) -> RegistryService:
+    """Get a registry service for the given registry data, creating it only once.
+
+    Validating several packages against the same registry would otherwise build
+    a new service (and accessor chain) for each of them. The cached service keeps
+    a reference to its registry data, so the identity key cannot be reused while
+    the entry is alive.
+
+    Since the service is shared, registry data changed in place between
+    validations is served by the same service. Packages and versions added or
+    removed are picked up automatically, but other in place edits, such as
+    changing an existing version entry, need a call to its clear_cache().
+
+    Args:
+        registry_data (Dict[str, Any]): Registry data to serve.
+
+    Returns:
+        RegistryService: Service wrapping the given registry data.
+    """
+    key = id(registry_data)
+    with _service_cache_lock:
+        service = _service_cache.get(key)
+        if service is None or service._registry_data is not registry_data:
+            service = RegistryService(registry_data)
+            _service_cache[key] = service
+    return service
@@ -1,4 +1,5 @@
-from typing import Dict, List, Any, Optional
+import threading
+from typing import Dict, List, Any, Optional, Tuple
 from hatch_validator.registry.registry_accessor_base import RegistryAccessorBase
 from hatch_validator.utils.version_utils import VersionConstraintValidator
 
@@ -7,8 +8,150 @@ class RegistryAccessor(RegistryAccessorBase):
     
     Handles the CrackingShells Package Registry format with repositories
     containing packages with versions.
+    
+    The lookups cached from the queried registry data are guarded by a lock,
+    so one accessor can serve validations running in parallel.
     """
     
+    __slots__ = ("_lock", "_cached_data", "_cached_shape", "_package_index", "_repository_names", "_package_names",
+                 "_version_counts", "_package_versions", "_version_index", "_sorted_versions",
+                 "_reconstructed_versions")
+    
+    def __init__(self, successor: Optional[RegistryAccessorBase] = None):
+        """Initialize the registry accessor.
+        
+        Args:
+            successor (Optional[RegistryAccessorBase]): Next accessor in the chain.
+        """
+        super().__init__(successor)
+        # Held while the cached lookups are checked, computed or read
+        self._lock = threading.RLock()
+        # Lookups computed from _cached_data, recomputed whenever other registry data is queried
+        self._cached_data: Optional[Dict[str, Any]] = None
+        # Number of packages of each repository of _cached_data when the lookups were computed
+        self._cached_shape: Optional[Tuple[int, ...]] = None
+        # Packages by (repo_name, package_name), and by (None, package_name) across all repositories
+        self._package_index: Optional[Dict[Tuple[Optional[str], str], Dict[str, Any]]] = None
+        # Names of the repositories, as a list in registry order and as a set
+        self._repository_names: Optional[Tuple[List[str], frozenset]] = None
+        # Package names by repository name, None for all repositories
+        self._package_names: Dict[Optional[str], List[str]] = {}
+        # Number of versions of a package when its version lookups were computed, by (repo_name, package_name)
+        self._version_counts: Dict[Tuple[Optional[str], str], int] = {}
+        # Package versions by (repo_name, package_name)
+        self._package_versions: Dict[Tuple[Optional[str], str], List[str]] = {}
+        # Version information by version string, by (repo_name, package_name)
+        self._version_index: Dict[Tuple[Optional[str], str], Dict[str, Dict[str, Any]]] = {}
+        # Package versions sorted highest first, by (repo_name, package_name)
+        self._sorted_versions: Dict[Tuple[Optional[str], str], List[str]] = {}
+        # Reconstructed dependencies by (repo_name, package_name, version)
+        self._reconstructed_versions: Dict[Tuple[Optional[str], str, Optional[str]], Dict[str, Any]] = {}
+    
+    def clear_cache(self) -> None:
+        """Forget the lookups computed from the last queried registry data.
+        
+        The lookups are recomputed automatically for other registry data, and
+        when packages or versions are added to or removed from the queried
+        registry data. This is only needed after other in place changes, such
+        as editing the entries of existing packages or versions.
+        """
+        with self._lock:
+            self._cached_data = None
+            self._cached_shape = None
+            self._package_index = None
+            self._repository_names = None
+            self._package_names = {}
+            self._version_counts = {}
+            self._package_versions = {}
+            self._version_index = {}
+            self._sorted_versions = {}
+            self._reconstructed_versions = {}
+    
+    def _use_cache_for(self, registry_data: Dict[str, Any]) -> None:
+        """Make sure the cached lookups were computed from the given registry data.
+        
+        Besides its identity, the number of packages of each repository is
+        compared, so that repositories or packages added in place are seen.
+        
+        Args:
+            registry_data (Dict[str, Any]): Registry data about to be queried.
+        """
+        shape = tuple(len(repo.get('packages', ())) for repo in registry_data.get('repositories', ()))
+        if self._cached_data is not registry_data or self._cached_shape != shape:
+            self.clear_cache()
+            self._cached_data = registry_data
+            self._cached_shape = shape
+    
+    def _find_package_for_versions(self, registry_data: Dict[str, Any], package_name: str, repo_name: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Find a package, forgetting its version lookups if its number of versions changed.
+        
+        Args:
+            registry_data (Dict[str, Any]): Registry data.
+            package_name (str): Package name.
+            repo_name (str, optional): Repository name. If None, search all repos.
+        Returns:
+            Optional[Dict[str, Any]]: Package object from the registry, or None if not found.
+        """
+        with self._lock:
+            pkg = self._find_package(registry_data, package_name, repo_name)
+            if pkg is None:
+                return None
+            key = (repo_name or None, package_name)
+            count = len(pkg.get('versions', ()))
+            if self._version_counts.get(key) != count:
+                self._version_counts[key] = count
+                self._package_versions.pop(key, None)
+                self._version_index.pop(key, None)
+                self._sorted_versions.pop(key, None)
+                self._reconstructed_versions = {
+                    k: v for k, v in self._reconstructed_versions.items() if k[:2] != key
+                }
+            return pkg
+    
+    def _get_package_index(self, registry_data: Dict[str, Any]) -> Dict[Tuple[Optional[str], str], Dict[str, Any]]:
+        """Get the package lookup index of the registry data, building it on first use.
+        
+        Like the scans it replaces, the index keeps the first package found for
+        a name, in repository order.
+        
+        Args:
+            registry_data (Dict[str, Any]): Registry data.
+            
+        Returns:
+            Dict[Tuple[Optional[str], str], Dict[str, Any]]: Packages by (repo_name, package_name),
+                and by (None, package_name) regardless of the repository.
+        """
+        with self._lock:
+            self._use_cache_for(registry_data)
+            if self._package_index is not None:
+                return self._package_index
+            
+            index = {}
+            setdefault = index.setdefault
+            for repo in registry_data.get('repositories', ()):
+                repo_name = repo.get('name')
+                for pkg in repo.get('packages', ()):
+                    name = pkg.get('name')
+                    if name is None:
+                        continue
+                    setdefault((None, name), pkg)
+                    if repo_name:
+                        setdefault((repo_name, name), pkg)
+            self._package_index = index
+            return index
+    
+    def _find_package(self, registry_data: Dict[str, Any], package_name: str, repo_name: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Find a package, optionally in a specific repo.
+        
+        Args:
+            registry_data (Dict[str, Any]): Registry data.
+            package_name (str): Package name.
+            repo_name (str, optional): Repository name. If None, search all repos.
+        Returns:
+            Optional[Dict[str, Any]]: Package object from the registry, or None if not found.
+        """
+        return self._get_package_index(registry_data).get((repo_name or None, package_name))
+    
     def can_handle(self, registry_data: Dict[str, Any]) -> bool:
         """Check if this accessor can handle the given registry data.
         
@@ -41,16 +184,20 @@ class RegistryAccessor(RegistryAccessorBase):
         Returns:
             List[str]: List of package names.
         """
-        package_names = []
-        repos = registry_data.get('repositories', [])
-        for repo in repos:
-            if repo_name and repo.get('name') != repo_name:
-                continue
-            for package in repo.get('packages', []):
-                name = package.get('name')
-                if name:
-                    package_names.append(name)
-        return package_names
+        with self._lock:
+            self._use_cache_for(registry_data)
+            repo_name = repo_name or None
+            package_names = self._package_names.get(repo_name)
+            if package_names is None:
+                repos = registry_data.get('repositories', ())
+                if repo_name:
+                    repos = [repo for repo in repos if repo.get('name') == repo_name]
+                package_names = [name for repo in repos
+                                 for name in (package.get('name') for package in repo.get('packages', ()))
+                                 if name]
+                self._package_names[repo_name] = package_names
+            # Callers get their own list, the cached one must stay unchanged
+            return list(package_names)
 
     def package_exists(self, registry_data: Dict[str, Any], package_name: str, repo_name: Optional[str] = None) -> bool:
         """Check if a package exists in the registry, optionally in a specific repo.
@@ -62,9 +209,7 @@ class RegistryAccessor(RegistryAccessorBase):
         Returns:
             bool: True if package exists.
         """
-        if repo_name:
-            return package_name in self.list_packages(registry_data, repo_name)
-        return package_name in self.get_all_package_names(registry_data, repo_name=None)
+        return self._find_package(registry_data, package_name, repo_name) is not None
 
     def get_package_versions(self, registry_data: Dict[str, Any], package_name: str, repo_name: Optional[str] = None) -> List[str]:
         """Get all versions for a package, optionally in a specific repo.
@@ -76,14 +221,29 @@ class RegistryAccessor(RegistryAccessorBase):
         Returns:
             List[str]: List of version strings.
         """
-        repos = registry_data.get('repositories', [])
-        for repo in repos:
-            if repo_name and repo.get('name') != repo_name:
-                continue
-            for pkg in repo.get('packages', []):
-                if pkg.get('name') == package_name:
-                    return [ver.get('version') for ver in pkg.get('versions', []) if ver.get('version')]
-        return []
+        # Callers get their own list, the cached one must stay unchanged
+        return list(self._get_versions(registry_data, package_name, repo_name))
+    
+    def _get_versions(self, registry_data: Dict[str, Any], package_name: str, repo_name: Optional[str] = None) -> List[str]:
+        """Get the shared list of versions of a package, computing it on first use.
+        
+        Args:
+            registry_data (Dict[str, Any]): Registry data.
+            package_name (str): Package name.
+            repo_name (str, optional): Repository name. If None, search all repos.
+        Returns:
+            List[str]: List of version strings, not to be modified.
+        """
+        with self._lock:
+            pkg = self._find_package_for_versions(registry_data, package_name, repo_name)
+            if pkg is None:
+                return []
+            key = (repo_name or None, package_name)
+            versions = self._package_versions.get(key)
+            if versions is None:
+                versions = [ver.get('version') for ver in pkg.get('versions', []) if ver.get('version')]
+                self._package_versions[key] = versions
+            return versions
 
     def get_package_metadata(self, registry_data: Dict[str, Any], package_name: str, repo_name: Optional[str] = None) -> Dict[str, Any]:
         """Get metadata for a package, optionally in a specific repo.
@@ -95,14 +255,8 @@ class RegistryAccessor(RegistryAccessorBase):
         Returns:
             Dict[str, Any]: Package metadata.
         """
-        repos = registry_data.get('repositories', [])
-        for repo in repos:
-            if repo_name and repo.get('name') != repo_name:
-                continue
-            for pkg in repo.get('packages', []):
-                if pkg.get('name') == package_name:
-                    return pkg
-        return {}
+        pkg = self._find_package(registry_data, package_name, repo_name)
+        return pkg if pkg is not None else {}
 
     def get_package_version_info(self, registry_data: Dict[str, Any], package_name: str, version: str, repo_name: Optional[str] = None) -> Dict[str, Any]:
         """Get metadata for a specific package version.
@@ -116,22 +270,43 @@ class RegistryAccessor(RegistryAccessorBase):
         Returns:
             Dict[str, Any]: Package metadata for the specified version.
         """
-        package_data = self.get_package_metadata(registry_data, package_name, repo_name)
-        if not package_data:
-            return {}
+        version_info = self._find_version(registry_data, package_name, version, repo_name)
+        return version_info if version_info is not None else {}
+    
+    def _find_version(self, registry_data: Dict[str, Any], package_name: str, version: str, repo_name: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Find the information of a package version.
         
-        versions = package_data.get('versions', [])
-        for v in versions:
-            if v.get('version') == version:
-                return v
+        The versions of a package are indexed on first use, keeping the first
+        entry of any repeated version like the scans it replaces.
         
-        return {}
+        Args:
+            registry_data (Dict[str, Any]): Registry data.
+            package_name (str): Package name.
+            version (str): Specific version to find.
+            repo_name (str, optional): Repository name. If None, search all repos.
+
+        Returns:
+            Optional[Dict[str, Any]]: Version information, or None if not found.
+        """
+        with self._lock:
+            package_data = self._find_package_for_versions(registry_data, package_name, repo_name)
+            if package_data is None:
+                return None
+            key = (repo_name or None, package_name)
+            index = self._version_index.get(key)
+            if index is None:
+                index = {}
+                for v in package_data.get('versions', []):
+                    index.setdefault(v.get('version'), v)
+                self._version_index[key] = index
+            return index.get(version)
 
     def get_package_dependencies(self, registry_data: Dict[str, Any], package_name: str, version: str = None, repo_name: Optional[str] = None) -> Dict[str, Any]:
         """Get reconstructed HATCH dependencies for a specific package version.
         
         This method reconstructs the complete dependency information from the differential
-        storage format used in the registry.
+        storage format used in the registry. Reconstructions are kept for repeated
+        queries of the same registry data.
         
         Args:
             registry_data (Dict[str, Any]): Registry data.
@@ -142,6 +317,30 @@ class RegistryAccessor(RegistryAccessorBase):
             Dict[str, Any]: Reconstructed package metadata with complete dependency information.
                 Contains keys: name, version, dependencies (hatch)
         """
+        with self._lock:
+            if self._find_package_for_versions(registry_data, package_name, repo_name) is None:
+                return {}
+            key = (repo_name or None, package_name, version)
+            reconstructed = self._reconstructed_versions.get(key)
+            if reconstructed is None:
+                reconstructed = self._get_package_dependencies(registry_data, package_name, version, repo_name)
+                if not reconstructed:
+                    return {}
+                self._reconstructed_versions[key] = reconstructed
+            # Callers get their own copy, the cached one must stay unchanged
+            return dict(reconstructed, dependencies=list(reconstructed["dependencies"]))
+    
+    def _get_package_dependencies(self, registry_data: Dict[str, Any], package_name: str, version: Optional[str], repo_name: Optional[str]) -> Dict[str, Any]:
+        """Reconstruct the HATCH dependencies of a package version, without caching.
+        
+        Args:
+            registry_data (Dict[str, Any]): Registry data.
+            package_name (str): Package name.
+            version (str, optional): Specific version. If None, uses latest version.
+            repo_name (str, optional): Repository name. If None, uses default repository.
+        Returns:
+            Dict[str, Any]: Reconstructed package metadata, or an empty dict if the version is not found.
+        """
         package_data = self.get_package_metadata(registry_data, package_name, repo_name)
         if not package_data:
             return {}
@@ -153,10 +352,7 @@ class RegistryAccessor(RegistryAccessorBase):
         # Find the specific version or use latest
         version_info = None
         if version:
-            for v in versions:
-                if v.get('version') == version:
-                    version_info = v
-                    break
+            version_info = self._find_version(registry_data, package_name, version, repo_name)
         else:
             # Use latest version (last in list)
             version_info = versions[-1]
@@ -180,15 +376,8 @@ class RegistryAccessor(RegistryAccessorBase):
             Dict[str, Any]: Reconstructed package metadata including dependencies and compatibility.
                 - Contains keys: name, version, dependencies (hatch)
         """
-        version_chain = []
         package_versions = package.get("versions", [])
-        
-        # Initialize with empty metadata
-        reconstructed = {
-            "name": package["name"],
-            "version": version_info["version"],
-            "dependencies": []
-        }
+        dependencies: List[Dict[str, Any]] = []
         
         # Apply changes from oldest to newest (reverse the chain)
         # Given that new versions are always appended to the end of the list during package updates,
@@ -196,24 +385,30 @@ class RegistryAccessor(RegistryAccessorBase):
         for ver in package_versions:
             # Process hatch dependencies
             # Add new dependencies
-            for dep in ver.get("hatch_dependencies_added", []):
-                reconstructed["dependencies"].append(dep)
+            dependencies.extend(ver.get("hatch_dependencies_added", []))
             
-            # Remove dependencies
-            for dep_name in ver.get("hatch_dependencies_removed", []):
-                reconstructed["dependencies"] = [
-                    d for d in reconstructed["dependencies"]
-                    if d.get("name") != dep_name
-                ]
+            # Remove dependencies, filtering the list once for all removed names
+            removed = ver.get("hatch_dependencies_removed")
+            if removed:
+                removed = set(removed)
+                dependencies = [d for d in dependencies if d.get("name") not in removed]
             
-            # Modify dependencies
-            for mod_dep in ver.get("hatch_dependencies_modified", []):
-                for i, dep in enumerate(reconstructed["dependencies"]):
-                    if dep.get("name") == mod_dep.get("name"):
-                        reconstructed["dependencies"][i] = mod_dep
-                        break
-        
-        return reconstructed
+            # Modify dependencies, replacing the first dependency of each name
+            modified = ver.get("hatch_dependencies_modified")
+            if modified:
+                positions = {}
+                for i, dep in enumerate(dependencies):
+                    positions.setdefault(dep.get("name"), i)
+                for mod_dep in modified:
+                    i = positions.get(mod_dep.get("name"))
+                    if i is not None:
+                        dependencies[i] = mod_dep
+        
+        return {
+            "name": package["name"],
+            "version": version_info["version"],
+            "dependencies": dependencies
+        }
 
     def get_package_uri(self, registry_data: Dict[str, Any], package_name: str, version: str = None, repo_name: Optional[str] = None) -> Optional[str]:
         """Get the URI for a specific package version.
@@ -244,20 +439,31 @@ class RegistryAccessor(RegistryAccessorBase):
         Returns:
             Optional[str]: Compatible version string, or None if not found.
         """
-        versions = self.get_package_versions(registry_data, package_name, repo_name)
-        if not versions:
-            return None
+        with self._lock:
+            versions = self._get_versions(registry_data, package_name, repo_name)
+            if not versions:
+                return None
 
-        if not version_constraint:
-            # Return latest version
-            return versions[-1] if versions else None
+            if not version_constraint:
+                # Return latest version
+                return versions[-1] if versions else None
 
-        # Use VersionConstraintValidator to filter compatible versions (prefer highest)
-        compatible_versions = [
-            v for v in sorted(versions, key=lambda x: tuple(int(p) if p.isdigit() else p for p in x.split('.')), reverse=True)
-            if VersionConstraintValidator.is_version_compatible(v, version_constraint)[0]
-        ]
-        return compatible_versions[0] if compatible_versions else None
+            # Sorted once per package, highest first following PEP 440. Invalid
+            # versions are left out, they never satisfy a constraint.
+            key = (repo_name or None, package_name)
+            sorted_versions = self._sorted_versions.get(key)
+            if sorted_versions is None:
+                parsed = [(VersionConstraintValidator.parse_version(v), v) for v in versions]
+                parsed = [(ver, v) for ver, v in parsed if ver is not None]
+                parsed.sort(key=lambda item: item[0], reverse=True)
+                sorted_versions = [v for _, v in parsed]
+                self._sorted_versions[key] = sorted_versions
+
+            # Use VersionConstraintValidator to find the highest compatible version
+            for v in sorted_versions:
+                if VersionConstraintValidator.is_version_compatible(v, version_constraint)[0]:
+                    return v
+            return None
 
     def get_package_by_repo(self, registry_data: Dict[str, Any], repo_name: str, package_name: str) -> Optional[Dict[str, Any]]:
         """Get a package by repository and package name.
@@ -269,12 +475,9 @@ class RegistryAccessor(RegistryAccessorBase):
         Returns:
             Optional[Dict[str, Any]]: Package metadata or None if not found.
         """
-        for repo in registry_data.get('repositories', []):
-            if repo.get('name') == repo_name:
-                for pkg in repo.get('packages', []):
-                    if pkg.get('name') == package_name:
-                        return pkg
-        return None
+        if not repo_name:
+            return None
+        return self._find_package(registry_data, package_name, repo_name)
 
     def list_repositories(self, registry_data: Dict[str, Any]) -> List[str]:
         """List all repository names in the registry.
@@ -285,7 +488,8 @@ class RegistryAccessor(RegistryAccessorBase):
         Returns:
             List[str]: List of repository names.
         """
-        return [repo.get('name') for repo in registry_data.get('repositories', [])]
+        # Callers get their own list, the cached one must stay unchanged
+        return list(self._get_repository_names(registry_data)[0])
 
     def repository_exists(self, registry_data: Dict[str, Any], repo_name: str) -> bool:
         """Check if a repository exists in the registry.
@@ -297,7 +501,27 @@ class RegistryAccessor(RegistryAccessorBase):
         Returns:
             bool: True if repository exists.
         """
-        return any(repo.get('name') == repo_name for repo in registry_data.get('repositories', []))
+        return repo_name in self._get_repository_names(registry_data)[1]
+
+    def _get_repository_names(self, registry_data: Dict[str, Any]) -> Tuple[List[str], frozenset]:
+        """Get the repository names of the registry data, computing them on first use.
+        
+        Service calls check whether package names start with a repository
+        name, so repository lookups are answered from a set.
+        
+        Args:
+            registry_data (Dict[str, Any]): Registry data.
+        
+        Returns:
+            Tuple[List[str], frozenset]: Repository names in registry order, not to be
+                modified, and the same names as a set.
+        """
+        with self._lock:
+            self._use_cache_for(registry_data)
+            if self._repository_names is None:
+                names = [repo.get('name') for repo in registry_data.get('repositories', [])]
+                self._repository_names = (names, frozenset(names))
+            return self._repository_names
 
     def list_packages(self, registry_data: Dict[str, Any], repo_name: str) -> List[str]:
         """List all package names in a given repository.
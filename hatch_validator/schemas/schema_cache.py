@@ -6,11 +6,24 @@ This module provides functionality for:
 3. Retrieving cached schema data
 """
 
+import copy
+import hashlib
 import json
 import logging
+import os
+import shutil
+import threading
+import time
+from contextlib import contextmanager
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import IO, Dict, Any, Iterator, Optional, Set, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
 
 # Configure logging
 logger = logging.getLogger("hatch.schema_cache")
@@ -21,7 +34,92 @@ DEFAULT_CACHE_TTL = 86400  # 24 hours in seconds
 DEFAULT_VERSION = "v1.2.0"  # Fallback if no version can be determined
 
 # Import schema types from schema_fetcher
-from .schema_fetcher import SCHEMA_TYPES
+from .schema_fetcher import SCHEMA_TYPES, SCHEMA_FILENAMES
+
+
+def _parse_timestamp(value: Any) -> Optional[float]:
+    """Convert an ISO 8601 timestamp to seconds since the epoch.
+    
+    Args:
+        value (Any): ISO 8601 timestamp, naive timestamps being taken as UTC
+        
+    Returns:
+        Optional[float]: Seconds since the epoch, or None if the value is not a valid timestamp
+    """
+    try:
+        updated = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except (ValueError, TypeError, AttributeError):
+        return None
+    if updated.tzinfo is None:
+        updated = updated.replace(tzinfo=timezone.utc)
+    return updated.timestamp()
+
+
+def _add_epoch_timestamp(info: Dict[str, Any]) -> None:
+    """Add the epoch timestamp to schema info written before it was recorded.
+    
+    It is derived from the ISO timestamp once, when the info is loaded, rather
+    than on every freshness check.
+    
+    Args:
+        info (Dict[str, Any]): Schema information, updated in place
+    """
+    if "updated_at_epoch" not in info:
+        updated_epoch = _parse_timestamp(info.get("updated_at"))
+        if updated_epoch is not None:
+            info["updated_at_epoch"] = updated_epoch
+
+
+def _temporary_path(path: Path) -> Path:
+    """Get a temporary sibling path for a file, unique per process and thread.
+    
+    Args:
+        path (Path): Path of the file the temporary file will replace
+        
+    Returns:
+        Path: Temporary path in the same directory
+    """
+    return path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+
+
+@contextmanager
+def _replace_atomically(path: Path, mode: str = "w") -> Iterator[IO]:
+    """Provide a temporary file that replaces the given path once written.
+    
+    Readers, including other processes, see either the previous or the new
+    complete file, never a partially written one. The temporary file name is
+    unique per process and thread, and its content is flushed to disk before
+    it replaces the file. Should writing fail, the temporary file is removed.
+    
+    Args:
+        path (Path): Path of the file to replace
+        mode (str, optional): Mode to open the temporary file with. Defaults to "w".
+        
+    Yields:
+        IO: Temporary file to write the new content to
+    """
+    tmp_path = _temporary_path(path)
+    try:
+        with open(tmp_path, mode) as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        _remove_quietly(tmp_path)
+        raise
+
+
+def _remove_quietly(path: Path) -> None:
+    """Remove a file if it exists, ignoring errors.
+    
+    Args:
+        path (Path): Path of the file to remove
+    """
+    try:
+        os.unlink(path)
+    except OSError:
+        pass
 
 
 class SchemaCache:
@@ -36,22 +134,50 @@ class SchemaCache:
         self.cache_dir = cache_dir
         self.info_file = cache_dir / "schema_info.json"
         self.cache_dir.mkdir(parents=True, exist_ok=True)
+        # Parsed schema info together with the mtime of the file it was read from
+        self._info_cache: Optional[Tuple[int, Dict[str, Any]]] = None
+        # Parsed schemas by file path, together with the mtime they were read at
+        self._schema_cache: Dict[Path, Tuple[int, Dict[str, Any]]] = {}
+        # Resolved latest versions by schema type, with the schema info they were resolved from
+        self._latest_versions: Dict[str, Tuple[Dict[str, Any], str]] = {}
+        # Schema directories already created by this instance
+        self._created_dirs: Set[Path] = set()
     
     def get_info(self) -> Dict[str, Any]:
         """Get cached schema information.
         
+        The parsed info is kept in memory and only read again when the file's
+        modification time changes. Callers get their own copy of it.
+        
         Returns:
             Dict[str, Any]: Dictionary with schema info or empty dict if not available
         """
-        if not self.info_file.exists():
+        return copy.deepcopy(self._get_info())
+    
+    def _get_info(self) -> Dict[str, Any]:
+        """Get the shared schema information kept in memory, reading it if needed.
+        
+        Returns:
+            Dict[str, Any]: Dictionary with schema info or empty dict if not available,
+                not to be modified
+        """
+        try:
+            mtime = self.info_file.stat().st_mtime_ns
+        except OSError:
             return {}
+        
+        if self._info_cache is not None and self._info_cache[0] == mtime:
+            return self._info_cache[1]
             
         try:
-            with open(self.info_file, "r") as f:
-                return json.load(f)
-        except (json.JSONDecodeError, IOError) as e:
+            info = json.loads(self.info_file.read_bytes())
+        except (ValueError, IOError) as e:
             logger.error(f"Error reading cache info: {e}")
             return {}
+        
+        _add_epoch_timestamp(info)
+        self._info_cache = (mtime, info)
+        return info
     
     def update_info(self, info: Dict[str, Any]) -> bool:
         """Update the cached schema information.
@@ -62,14 +188,58 @@ class SchemaCache:
         Returns:
             bool: True if update succeeded, False otherwise
         """
+        self._info_cache = None
         try:
-            with open(self.info_file, "w") as f:
+            with _replace_atomically(self.info_file) as f:
                 json.dump(info, f, indent=2)
+            # The written info is what the next read would parse, keep it in memory
+            cached_info = copy.deepcopy(info)
+            _add_epoch_timestamp(cached_info)
+            self._info_cache = (self.info_file.stat().st_mtime_ns, cached_info)
             return True
         except IOError as e:
             logger.error(f"Error writing cache info: {e}")
             return False
     
+    @contextmanager
+    def update_lock(self) -> Iterator[None]:
+        """Hold an exclusive lock on the cache directory, shared by all processes.
+        
+        The lock only coordinates schema updates. Should it not be acquired,
+        the update proceeds unlocked.
+        
+        Yields:
+            None: Control while the lock is held
+        """
+        try:
+            lock_file = open(self.cache_dir / ".update.lock", "a+b")
+        except OSError as e:
+            logger.warning(f"Could not open the schema cache lock file: {e}")
+            yield
+            return
+        
+        with lock_file:
+            locked = False
+            try:
+                if fcntl is not None:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+                else:
+                    lock_file.seek(0)
+                    msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+                locked = True
+            except OSError as e:
+                logger.warning(f"Could not lock the schema cache: {e}")
+            
+            try:
+                yield
+            finally:
+                if locked:
+                    if fcntl is not None:
+                        fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+                    else:
+                        lock_file.seek(0)
+                        msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+    
     def is_fresh(self, max_age: int = DEFAULT_CACHE_TTL) -> bool:
         """Check if the cache is still fresh.
         
@@ -79,29 +249,31 @@ class SchemaCache:
         Returns:
             bool: True if cache is fresh, False otherwise
         """
-        info = self.get_info()
-        if not info or "updated_at" not in info:
-            return False
-            
-        try:
-            updated_str = info["updated_at"].replace("Z", "+00:00")
-            updated = datetime.fromisoformat(updated_str)
-            if updated.tzinfo is None:
-                updated = updated.replace(tzinfo=timezone.utc)
-                
-            now = datetime.now(timezone.utc)
-            age = (now - updated).total_seconds()
-            
-            return age < max_age
-        except (ValueError, TypeError):
-            return False
+        age = self.get_age()
+        return age is not None and age < max_age
+    
+    def get_age(self) -> Optional[float]:
+        """Get the time elapsed since the cached schemas were last checked for updates.
+        
+        Returns:
+            Optional[float]: Age of the cache in seconds, or None if unknown
+        """
+        info = self._get_info()
+        if not info:
+            return None
+        
+        updated_epoch = info.get("updated_at_epoch")
+        if isinstance(updated_epoch, (int, float)):
+            return time.time() - updated_epoch
+        return None
     
-    def get_schema_path(self, schema_type: str, version: str = None) -> Path:
+    def get_schema_path(self, schema_type: str, version: str = None, create: bool = True) -> Path:
         """Get the path where a schema should be stored.
         
         Args:
             schema_type (str): Type of schema ("package" or "registry")
             version (str, optional): Schema version. If provided, schema will be stored in a version-specific folder. Defaults to None.
+            create (bool, optional): If True, create the schema's directory. Reads can skip it. Defaults to True.
             
         Returns:
             Path: Path object for the schema file
@@ -109,7 +281,8 @@ class SchemaCache:
         Raises:
             ValueError: If the schema type is unknown
         """
-        if schema_type not in SCHEMA_TYPES:
+        filename = SCHEMA_FILENAMES.get(schema_type)
+        if filename is None:
             raise ValueError(f"Unknown schema type: {schema_type}")
 
         # Base directory for this schema type
@@ -126,8 +299,10 @@ class SchemaCache:
             # No version specified, use the main schema directory
             schema_dir = base_dir
             
-        schema_dir.mkdir(parents=True, exist_ok=True)
-        return schema_dir / SCHEMA_TYPES[schema_type]["filename"]
+        if create and schema_dir not in self._created_dirs:
+            schema_dir.mkdir(parents=True, exist_ok=True)
+            self._created_dirs.add(schema_dir)
+        return schema_dir / filename
     
     def has_schema(self, schema_type: str, version: str = None) -> bool:
         """Check if a schema exists in the cache.
@@ -140,10 +315,17 @@ class SchemaCache:
             bool: True if schema exists in cache, False otherwise
         """
         try:
-            path = self.get_schema_path(schema_type, version)
-            return path.exists() and path.stat().st_size > 0
-        except ValueError:
+            path = self.get_schema_path(schema_type, version, create=False)
+            size = path.stat().st_size
+        except (ValueError, OSError):
             return False
+        
+        # A size differing from the one recorded at download time means a truncated file
+        digest = self._get_recorded_digest(schema_type, version)
+        if digest is not None and digest.get("size") not in (None, size):
+            logger.warning(f"Cached {schema_type} schema at {path} has an unexpected size")
+            return False
+        return size > 0
     
     def load_schema(self, schema_type: str, version: str = None) -> Optional[Dict[str, Any]]:
         """Load a schema from the cache.
@@ -152,41 +334,181 @@ class SchemaCache:
             schema_type (str): Type of schema ("package" or "registry")
             version (str, optional): Schema version to load. If None, loads the default schema. Defaults to None.
             
+        Parsed schemas are kept in memory and only read again when the file's
+        modification time changes. Callers get their own copy of them.
+        
         Returns:
             Optional[Dict[str, Any]]: Schema as a dictionary or None if not available
         """
         try:
-            path = self.get_schema_path(schema_type, version)
-            if not path.exists():
+            path = self.get_schema_path(schema_type, version, create=False)
+            try:
+                mtime = path.stat().st_mtime_ns
+            except OSError:
                 return None
+            
+            cached = self._schema_cache.get(path)
+            if cached is not None and cached[0] == mtime:
+                return copy.deepcopy(cached[1])
                 
-            with open(path, "r") as f:
-                logger.info(f"Loading cached schema {schema_type} version {version} from {path}")
-                return json.load(f)
+            logger.info(f"Loading cached schema {schema_type} version {version} from {path}")
+            data = path.read_bytes()
+            
+            # Detect corrupted files before parsing them
+            digest = self._get_recorded_digest(schema_type, version)
+            if digest is not None and digest.get("sha256") not in (None, hashlib.sha256(data).hexdigest()):
+                logger.warning(f"Cached {schema_type} schema at {path} does not match its recorded checksum")
+                return None
+            
+            schema = json.loads(data)
+            self._schema_cache[path] = (mtime, copy.deepcopy(schema))
+            return schema
         except (ValueError, json.JSONDecodeError, IOError) as e:
             logger.error(f"Error loading cached schema: {e}")
             return None
     
-    def save_schema(self, schema_type: str, schema: Dict[str, Any], version: str = None) -> bool:
+    def invalidate(self) -> None:
+        """Forget the schema info and schemas kept in memory.
+        
+        The next lookups read the files again, and schema directories are
+        created again if needed. This is only needed when the files may have
+        changed without their modification time changing, as on filesystems
+        with a coarse timestamp resolution, or when the cache directory was
+        cleared by another program.
+        """
+        self._info_cache = None
+        self._schema_cache.clear()
+        self._latest_versions.clear()
+        self._created_dirs.clear()
+    
+    def save_schema(self, schema_type: str, schema: Dict[str, Any], version: str = None,
+                    content: Optional[bytes] = None) -> bool:
         """Save a schema to the cache.
         
         Args:
             schema_type (str): Type of schema ("package" or "registry")
             schema (Dict[str, Any]): Schema data to save
             version (str, optional): Schema version. If provided, schema will be stored in a version-specific folder. Defaults to None.
+            content (bytes, optional): Serialized schema, written as is instead of serializing the schema data. Defaults to None.
             
         Returns:
             bool: True if save succeeded, False otherwise
         """
         try:
             path = self.get_schema_path(schema_type, version)
-            with open(path, "w") as f:
-                json.dump(schema, f, indent=2)
+            self._schema_cache.pop(path, None)
+            try:
+                self._write_schema(path, schema, content)
+            except FileNotFoundError:
+                # The directory was removed since it was created, as when another
+                # program cleared the cache, create it again
+                self._created_dirs.discard(path.parent)
+                path = self.get_schema_path(schema_type, version)
+                self._write_schema(path, schema, content)
+            # The saved schema is what the next load would parse, keep it in memory
+            self._schema_cache[path] = (path.stat().st_mtime_ns, copy.deepcopy(schema))
             return True
         except (ValueError, IOError) as e:
             logger.error(f"Error saving schema to cache: {e}")
             return False
     
+    @staticmethod
+    def _write_schema(path: Path, schema: Dict[str, Any], content: Optional[bytes]) -> None:
+        """Write a schema file, from its serialized content when given.
+        
+        Args:
+            path (Path): Path of the schema file
+            schema (Dict[str, Any]): Schema data to serialize if no content is given
+            content (bytes, optional): Serialized schema, written as is
+        """
+        if content is not None:
+            with _replace_atomically(path, "wb") as f:
+                f.write(content)
+        else:
+            # Schema files are only read by programs, write them compact
+            with _replace_atomically(path) as f:
+                json.dump(schema, f, separators=(",", ":"))
+    
+    def copy_schema(self, schema_type: str, version: str) -> bool:
+        """Copy a cached schema version to the default schema location.
+        
+        The default location is made a hard link to the version file, or a copy
+        of it where hard links are not supported. Either way the file is not
+        serialized again from the parsed schema.
+        
+        Args:
+            schema_type (str): Type of schema ("package" or "registry")
+            version (str): Cached schema version to copy
+            
+        Returns:
+            bool: True if the copy succeeded, False otherwise
+        """
+        try:
+            source = self.get_schema_path(schema_type, version, create=False)
+            target = self.get_schema_path(schema_type)
+            self._schema_cache.pop(target, None)
+            tmp_path = _temporary_path(target)
+            try:
+                os.link(source, tmp_path)
+            except OSError:
+                # No hard links on this filesystem, copy the file instead
+                with open(source, "rb") as src, _replace_atomically(target, "wb") as dst:
+                    shutil.copyfileobj(src, dst)
+            else:
+                try:
+                    os.replace(tmp_path, target)
+                except OSError:
+                    _remove_quietly(tmp_path)
+                    raise
+            cached = self._schema_cache.get(source)
+            if cached is not None:
+                self._schema_cache[target] = (target.stat().st_mtime_ns, cached[1])
+            return True
+        except (ValueError, OSError) as e:
+            logger.error(f"Error copying cached schema: {e}")
+            return False
+    
+    def get_schema_digest(self, schema_type: str, version: str = None) -> Optional[Dict[str, Any]]:
+        """Compute the size and SHA-256 checksum of a cached schema file.
+        
+        The result is meant to be recorded in the schema information of the
+        schema type, so that later loads can detect corrupted files.
+        
+        Args:
+            schema_type (str): Type of schema ("package" or "registry")
+            version (str, optional): Schema version. If None, uses the default schema. Defaults to None.
+            
+        Returns:
+            Optional[Dict[str, Any]]: Dictionary with "size" and "sha256" keys, or None if the file cannot be read
+        """
+        try:
+            data = self.get_schema_path(schema_type, version, create=False).read_bytes()
+        except (ValueError, OSError) as e:
+            logger.error(f"Error reading cached schema: {e}")
+            return None
+        return {"size": len(data), "sha256": hashlib.sha256(data).hexdigest()}
+    
+    def _get_recorded_digest(self, schema_type: str, version: Optional[str]) -> Optional[Dict[str, Any]]:
+        """Get the schema information recorded for a cached schema file, if any.
+        
+        Only the default schema and the latest version have recorded digests.
+        
+        Args:
+            schema_type (str): Type of schema ("package" or "registry")
+            version (str, optional): Schema version, or None for the default schema
+            
+        Returns:
+            Optional[Dict[str, Any]]: Schema information of the schema type, or None if not recorded
+        """
+        entry = self._get_info().get(schema_type)
+        if not isinstance(entry, dict):
+            return None
+        if version is not None:
+            recorded = entry.get("version") or ""
+            if recorded.lstrip("v") != version.lstrip("v"):
+                return None
+        return entry
+    
     def get_latest_version(self, schema_type: str) -> str:
         """Get the latest known version of a schema type.
         
@@ -196,11 +518,19 @@ class SchemaCache:
         Returns:
             str: Latest version string with 'v' prefix or default version if not found
         """
-        info = self.get_info()
+        info = self._get_info()
+        
+        # The resolved version stays valid as long as the schema info is not reloaded
+        cached = self._latest_versions.get(schema_type)
+        if cached is not None and cached[0] is info:
+            return cached[1]
+        
         version = info.get(f"latest_{schema_type}_version")
         
         # Ensure version has 'v' prefix
         if version and not version.startswith('v'):
             version = f"v{version}"
-            
-        return version if version else DEFAULT_VERSION
+        
+        version = version if version else DEFAULT_VERSION
+        self._latest_versions[schema_type] = (info, version)
+        return version
@@ -7,9 +7,15 @@ This module provides functionality for:
 
 import json
 import logging
-from typing import Dict, Any, Optional
+import os
+import time
+from datetime import datetime, timezone
+from typing import Dict, Any, Optional, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import MaxRetryError, ResponseError
+from urllib3.util.retry import Retry
 
 # Configure logging
 logger = logging.getLogger("hatch.schema_fetcher")
@@ -31,6 +37,68 @@ SCHEMA_TYPES = {
 }
 
 
+# Schema file name by schema type, for lookups on every cache access
+SCHEMA_FILENAMES = {schema_type: config["filename"] for schema_type, config in SCHEMA_TYPES.items()}
+
+# Release tag prefix to (schema type, info version key, file name), and the
+# distinct prefix lengths to slice tags with when looking them up
+_TAG_PREFIXES = {
+    config["tag_prefix"]: (schema_type, f"latest_{schema_type}_version", config["filename"])
+    for schema_type, config in SCHEMA_TYPES.items()
+}
+_TAG_PREFIX_LENGTHS = sorted({len(prefix) for prefix in _TAG_PREFIXES})
+
+# Releases requested per page, the latest schema releases are usually among the first ones
+RELEASES_PER_PAGE = 30
+
+# Most release pages looked through for the latest schema releases
+MAX_RELEASE_PAGES = 5
+
+# Maximum number of schema downloads running at the same time, each one
+# keeps its own pooled connection
+MAX_CONCURRENT_DOWNLOADS = 5
+
+# Longest Retry-After delay in seconds waited for before retrying a rate limited request
+MAX_RETRY_AFTER = 10
+
+# Times a request answered with one of these statuses is retried
+MAX_STATUS_RETRIES = 3
+RETRY_STATUSES = (429, 502, 503, 504)
+
+
+class _BoundedRetry(Retry):
+    """Retry policy giving up on a Retry-After header longer than MAX_RETRY_AFTER seconds.
+    
+    GitHub may ask to wait until its rate limit resets, up to an hour later,
+    which no validation should block on. The response is then returned as is,
+    so that the rate limit reset it reports is remembered by the fetcher.
+    """
+    
+    def increment(self, method=None, url=None, response=None, error=None, _pool=None, _stacktrace=None) -> Retry:
+        """Count a retry, unless the response asks to wait longer than MAX_RETRY_AFTER.
+        
+        Args:
+            method (str, optional): Method of the failed request
+            url (str, optional): URL of the failed request
+            response (optional): urllib3 response of the failed request
+            error (Exception, optional): Error raised by the failed request
+            _pool (optional): Connection pool of the request
+            _stacktrace (optional): Traceback of the error
+            
+        Returns:
+            Retry: Retry policy for the next attempt
+            
+        Raises:
+            MaxRetryError: If no more retries should be made
+        """
+        if response is not None:
+            retry_after = self.get_retry_after(response)
+            if retry_after is not None and retry_after > MAX_RETRY_AFTER:
+                raise MaxRetryError(_pool, url, ResponseError(
+                    f"Retry-After of {retry_after:.0f}s exceeds {MAX_RETRY_AFTER}s"))
+        return super().increment(method, url, response, error, _pool, _stacktrace)
+
+
 class SchemaFetcher:
     """Handles network operations to retrieve schemas from GitHub."""
     
@@ -43,22 +111,119 @@ class SchemaFetcher:
         """
         self.api_base = api_base
         self.releases_base = releases_base
+        # Cache validators ("etag", "last_modified") of the last releases response
+        self.releases_validators: Dict[str, str] = {}
+        # Shared session so the releases listing and schema downloads reuse connections
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            # API, release downloads and the release assets host they redirect to
+            pool_connections=3,
+            pool_maxsize=MAX_CONCURRENT_DOWNLOADS,
+            # Only responses with a retry status are retried, after the delay GitHub
+            # asks for, connection errors fail at once. Responses still failing are
+            # returned as is, for the rate limit check and raise_for_status.
+            max_retries=_BoundedRetry(total=None, connect=0, read=0, redirect=None, other=0,
+                                      status=MAX_STATUS_RETRIES, status_forcelist=RETRY_STATUSES,
+                                      backoff_factor=0.2, respect_retry_after_header=True,
+                                      raise_on_status=False),
+        )
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+        self._session.headers["User-Agent"] = "hatch-validator"
+        
+        # GitHub API requests are authenticated when a token is available,
+        # which raises the rate limit from 60 to 5000 requests per hour
+        self._api_headers = {"Accept": "application/vnd.github+json"}
+        token = os.environ.get("GITHUB_TOKEN")
+        if token:
+            self._api_headers["Authorization"] = f"Bearer {token}"
+        # Epoch time until which the GitHub API rate limit is known to be exhausted
+        self._rate_limit_reset: Optional[float] = None
+    
+    def close(self) -> None:
+        """Close the pooled connections of the fetcher's session."""
+        self._session.close()
     
-    def get_releases(self) -> list:
+    def __enter__(self) -> "SchemaFetcher":
+        """Use the fetcher as a context manager closing its connections on exit.
+        
+        Returns:
+            SchemaFetcher: This fetcher
+        """
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Close the fetcher's connections when leaving the context."""
+        self.close()
+    
+    def get_releases(self, etag: Optional[str] = None, last_modified: Optional[str] = None, page: int = 1) -> Optional[list]:
         """Fetch GitHub releases information.
         
+        Releases are listed newest first, RELEASES_PER_PAGE at a time.
+        When the validators of a previous response are given, the request is made
+        conditional and GitHub answers with an empty 304 if nothing changed.
+        
+        Args:
+            etag (str, optional): ETag of the previous releases response. Defaults to None.
+            last_modified (str, optional): Last-Modified of the previous releases response. Defaults to None.
+            page (int, optional): Page of releases to fetch, starting at 1. Defaults to 1.
+        
         Returns:
-            list: List containing release data or empty list if fetch fails
+            Optional[list]: List containing release data, empty list if fetch fails,
+                or None if the releases did not change since the previous response
         """
+        if self._rate_limit_reset is not None:
+            if time.time() < self._rate_limit_reset:
+                logger.warning("GitHub API rate limit exhausted, not requesting releases until it resets")
+                return []
+            self._rate_limit_reset = None
+        
+        headers = dict(self._api_headers)
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+        
         try:
             logger.debug(f"Requesting releases from {self.api_base}/releases")
-            response = requests.get(f"{self.api_base}/releases", timeout=10)
+            response = self._session.get(f"{self.api_base}/releases", headers=headers, timeout=10,
+                                         params={"per_page": RELEASES_PER_PAGE, "page": page})
+            self._check_rate_limit(response)
+            if response.status_code == 304:
+                logger.debug("Releases not modified since the previous request")
+                return None
             response.raise_for_status()
-            return response.json()
-        except requests.RequestException as e:
+            if page != 1:
+                return json.loads(response.content)
+            self.releases_validators = {
+                key: value for key, value in (
+                    ("etag", response.headers.get("ETag")),
+                    ("last_modified", response.headers.get("Last-Modified")),
+                ) if value
+            }
+            # Parse the raw body, json detects the UTF encoding without decoding it first
+            return json.loads(response.content)
+        except (requests.RequestException, ValueError) as e:
             logger.error(f"Error fetching releases: {e}")
             return []
     
+    def _check_rate_limit(self, response: requests.Response) -> None:
+        """Remember when the GitHub API rate limit reported by a response resets.
+        
+        Once no request is left, further releases requests are skipped until
+        then instead of failing one after the other.
+        
+        Args:
+            response (requests.Response): Response of a GitHub API request
+        """
+        if response.headers.get("X-RateLimit-Remaining") != "0":
+            return
+        try:
+            self._rate_limit_reset = float(response.headers["X-RateLimit-Reset"])
+        except (KeyError, ValueError):
+            return
+        logger.warning("GitHub API rate limit exhausted")
+    
     def extract_schema_info(self, releases: list) -> Dict[str, Any]:
         """Process GitHub releases data to extract schema information.
         
@@ -68,28 +233,39 @@ class SchemaFetcher:
         Returns:
             Dict[str, Any]: Dictionary with extracted schema information
         """
-        from datetime import datetime, timezone
-        
         info = {
-            "updated_at": datetime.now(timezone.utc).isoformat()
+            "updated_at": datetime.now(timezone.utc).isoformat(),
+            "updated_at_epoch": time.time()
         }
+        remaining = set(SCHEMA_TYPES)
         
         for release in releases:
             tag = release.get('tag_name', '')
             
-            for schema_type, config in SCHEMA_TYPES.items():
-                prefix = config['tag_prefix']
-                version_key = f"latest_{schema_type}_version"
+            # Look the tag prefix up instead of testing every schema type
+            for length in _TAG_PREFIX_LENGTHS:
+                match = _TAG_PREFIXES.get(tag[:length])
+                if match is not None:
+                    break
+            else:
+                continue
+            
+            schema_type, version_key, filename = match
+            
+            # Only process the first (latest) release for each type
+            if schema_type in remaining:
+                version = tag[length:]
+                info[version_key] = version
+                info[schema_type] = {
+                    'version': version,
+                    'url': f"{self.releases_base}/{tag}/{filename}",
+                    'release_url': release.get('html_url', '')
+                }
+                remaining.discard(schema_type)
                 
-                # Only process the first (latest) release for each type
-                if tag.startswith(prefix) and version_key not in info:
-                    version = tag.replace(prefix, '')
-                    info[version_key] = version
-                    info[schema_type] = {
-                        'version': version,
-                        'url': f"{self.releases_base}/{tag}/{config['filename']}",
-                        'release_url': release.get('html_url', '')
-                    }
+                # Releases are listed newest first, older ones cannot change the result
+                if not remaining:
+                    break
         
         return info
     
@@ -102,14 +278,58 @@ class SchemaFetcher:
         Returns:
             Optional[Dict[str, Any]]: Schema as a dictionary or None if download fails
         """
+        return self.download_schema_if_modified(url)[1]
+    
+    def download_schema_if_modified(self, url: str, etag: Optional[str] = None) -> Tuple[bool, Optional[Dict[str, Any]], Optional[str]]:
+        """Download a schema JSON file from URL unless it matches a previous download.
+        
+        Args:
+            url (str): URL to download the schema from
+            etag (str, optional): ETag of the previously downloaded schema. Defaults to None.
+            
+        Returns:
+            Tuple[bool, Optional[Dict[str, Any]], Optional[str]]: Tuple containing:
+                - bool: False if the schema did not change since the download with the given ETag
+                - Optional[Dict[str, Any]]: Schema as a dictionary, or None if not modified or download fails
+                - Optional[str]: ETag of the downloaded schema, if any
+        """
+        modified, content, etag = self.download_schema_content_if_modified(url, etag)
+        if content is None:
+            return modified, None, etag
+        try:
+            return modified, json.loads(content), etag
+        except ValueError as e:
+            logger.error(f"Error downloading schema: {e}")
+            return True, None, None
+    
+    def download_schema_content_if_modified(self, url: str, etag: Optional[str] = None) -> Tuple[bool, Optional[bytes], Optional[str]]:
+        """Download the raw content of a schema file unless it matches a previous download.
+        
+        The content is returned as received, so that it can be written to the
+        cache without serializing the parsed schema again.
+        
+        Args:
+            url (str): URL to download the schema from
+            etag (str, optional): ETag of the previously downloaded schema. Defaults to None.
+            
+        Returns:
+            Tuple[bool, Optional[bytes], Optional[str]]: Tuple containing:
+                - bool: False if the schema did not change since the download with the given ETag
+                - Optional[bytes]: Schema file content, or None if not modified or download fails
+                - Optional[str]: ETag of the downloaded schema, if any
+        """
+        headers = {"If-None-Match": etag} if etag else {}
         try:
             logger.info(f"Downloading schema from {url}")
-            response = requests.get(url, timeout=30)
+            response = self._session.get(url, headers=headers, timeout=30)
+            if etag and response.status_code == 304:
+                logger.debug(f"Schema at {url} not modified")
+                return False, None, etag
             response.raise_for_status()
-            return response.json()
-        except (requests.RequestException, json.JSONDecodeError) as e:
+            return True, response.content, response.headers.get("ETag")
+        except requests.RequestException as e:
             logger.error(f"Error downloading schema: {e}")
-            return None
+            return True, None, None
     
     def download_specific_version(self, schema_type: str, version: str) -> Optional[Dict[str, Any]]:
         """Download a specific schema version directly.
@@ -121,6 +341,25 @@ class SchemaFetcher:
         Returns:
             Optional[Dict[str, Any]]: Schema as a dictionary or None if download fails
         """
+        content = self.download_specific_version_content(schema_type, version)
+        if content is None:
+            return None
+        try:
+            return json.loads(content)
+        except ValueError as e:
+            logger.error(f"Error downloading schema: {e}")
+            return None
+    
+    def download_specific_version_content(self, schema_type: str, version: str) -> Optional[bytes]:
+        """Download the raw content of a specific schema version directly.
+        
+        Args:
+            schema_type (str): Type of schema ("package" or "registry")
+            version (str): Version to download, should include 'v' prefix
+            
+        Returns:
+            Optional[bytes]: Schema file content or None if download fails
+        """
         if schema_type not in SCHEMA_TYPES:
             logger.error(f"Unknown schema type: {schema_type}")
             return None
@@ -134,4 +373,4 @@ class SchemaFetcher:
         url = f"{self.releases_base}/{tag}/{config['filename']}"
         
         logger.info(f"Downloading {schema_type} schema version {version} from {url}")
-        return self.download_schema(url)
+        return self.download_schema_content_if_modified(url)[1]
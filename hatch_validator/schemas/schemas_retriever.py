@@ -7,17 +7,43 @@ This module provides utilities for:
 4. Validating schema updates and version management
 """
 
+import json
 import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
+
+import jsonschema
+
+try:
+    from referencing.exceptions import Unresolvable as _RefResolutionError
+except ImportError:
+    # jsonschema before 4.18 resolves references itself
+    _RefResolutionError = jsonschema.exceptions.RefResolutionError
 
 # Import the separated classes
-from .schema_fetcher import SchemaFetcher, SCHEMA_TYPES
-from .schema_cache import SchemaCache, CACHE_DIR
+from .schema_fetcher import SchemaFetcher, SCHEMA_TYPES, MAX_CONCURRENT_DOWNLOADS, RELEASES_PER_PAGE, MAX_RELEASE_PAGES
+from .schema_cache import SchemaCache, CACHE_DIR, DEFAULT_CACHE_TTL
 
 # Configure logging
 logger = logging.getLogger("hatch.schema_retriever")
 
+# Fraction of the cache TTL after which schemas are refreshed in the background
+SOFT_TTL_RATIO = 0.8
+# Minimum delay in seconds between two background refresh attempts
+BACKGROUND_REFRESH_INTERVAL = 300
+# Minimum delay in seconds between two non-forced update checks of one retriever
+UPDATE_CHECK_COOLDOWN = 60
+
+# Errors other than validation errors that checking metadata against a schema
+# can raise: unreadable or invalid schemas, unresolvable $ref, and metadata of
+# the wrong type
+SCHEMA_EVALUATION_ERRORS = (OSError, ValueError, TypeError, AttributeError,
+                            jsonschema.exceptions.SchemaError, _RefResolutionError)
+
 class SchemaRetriever:
     """Main class for retrieving and managing schemas."""
     
@@ -29,18 +55,56 @@ class SchemaRetriever:
         """
         self.cache = SchemaCache(cache_dir or CACHE_DIR)
         self.fetcher = SchemaFetcher()
+        self._refresh_lock = threading.Lock()
+        self._refreshing = False
+        self._last_refresh_attempt: Optional[float] = None
+        self._last_update_check: Optional[float] = None
+        # Lookups in progress by (schema_type, version, force_update)
+        self._inflight: Dict[Tuple[str, str, bool], Future] = {}
+        self._inflight_lock = threading.Lock()
     
     def get_schema(self, schema_type: str, version: str = "latest", force_update: bool = False) -> Optional[Dict[str, Any]]:
         """Get a schema, either from cache or by downloading.
         
         This is the main method for obtaining schema data. It first tries to get the schema from the cache,
         and if not available or if updates are forced, it attempts to download it.
+        Concurrent calls for the same schema share a single lookup.
         
         Args:
             schema_type (str): Type of schema ("package" or "registry")
             version (str, optional): Version of schema or "latest". Defaults to "latest".
             force_update (bool, optional): If True, force check for updates regardless of cache status. Defaults to False.
             
+        Returns:
+            Optional[Dict[str, Any]]: Schema as a dictionary or None if not available
+        """
+        key = (schema_type, version, force_update)
+        with self._inflight_lock:
+            lookup = self._inflight.get(key)
+            leader = lookup is None
+            if leader:
+                lookup = self._inflight[key] = Future()
+        
+        if not leader:
+            return lookup.result()
+        
+        try:
+            lookup.set_result(self._get_schema(schema_type, version, force_update))
+        except BaseException as e:
+            lookup.set_exception(e)
+        finally:
+            with self._inflight_lock:
+                del self._inflight[key]
+        return lookup.result()
+    
+    def _get_schema(self, schema_type: str, version: str, force_update: bool) -> Optional[Dict[str, Any]]:
+        """Get a schema, either from cache or by downloading, without coalescing calls.
+        
+        Args:
+            schema_type (str): Type of schema ("package" or "registry")
+            version (str): Version of schema or "latest"
+            force_update (bool): If True, force check for updates regardless of cache status
+            
         Returns:
             Optional[Dict[str, Any]]: Schema as a dictionary or None if not available
         """
@@ -50,62 +114,186 @@ class SchemaRetriever:
             return None
           # For "latest", try to update cache if needed and return the cached version
         if version == "latest":
-            if force_update or not self.cache.is_fresh() or not self.cache.has_schema(schema_type):
-                self.update_schemas(force=force_update)
-            
-            # First try to get the latest version number
-            latest_version = self.cache.get_latest_version(schema_type)
-            
-            # Try to load the schema from the version-specific folder first,
-            # fallback to the main folder if not found
-            schema = self.cache.load_schema(schema_type, latest_version)
-            if schema:
+            # update_schemas checks the cache freshness itself
+            self.update_schemas(force=force_update)
+            schema = self._load_latest_schema(schema_type)
+            if schema or force_update:
                 return schema
-            return self.cache.load_schema(schema_type)
+            
+            # A missing schema has to be downloaded even if the cache info is fresh
+            self.update_schemas(force=True)
+            return self._load_latest_schema(schema_type)
           # For specific version, first check if it's already in the cache
         normalized_version = version if version.startswith('v') else f"v{version}"
-        if not force_update and self.cache.has_schema(schema_type, normalized_version):
-            return self.cache.load_schema(schema_type, normalized_version)
+        if not force_update:
+            # A single lookup, a missing or unreadable file loads as None
+            schema = self.cache.load_schema(schema_type, normalized_version)
+            if schema:
+                return schema
             
         # If not in cache or force update, download it directly
-        schema_data = self.fetcher.download_specific_version(schema_type, version)
+        content = self.fetcher.download_specific_version_content(schema_type, version)
+        schema_data = None
+        if content is not None:
+            try:
+                schema_data = json.loads(content)
+            except ValueError as e:
+                logger.error(f"Error parsing downloaded {schema_type} schema version {version}: {e}")
         if schema_data:
-            # Cache the specific version in its own folder
-            self.cache.save_schema(schema_type, schema_data, normalized_version)
+            # Cache the specific version in its own folder, as received
+            self.cache.save_schema(schema_type, schema_data, normalized_version, content=content)
             return schema_data
             
         logger.error(f"Could not retrieve {schema_type} schema version {version}")
         return None
     
+    def get_schemas(self, schemas: List[Tuple[str, str]], force_update: bool = False) -> Dict[Tuple[str, str], Optional[Dict[str, Any]]]:
+        """Get several schemas at once, downloading the missing ones concurrently.
+        
+        Args:
+            schemas (List[Tuple[str, str]]): (schema_type, version) pairs to get, version may be "latest"
+            force_update (bool, optional): If True, force check for updates regardless of cache status. Defaults to False.
+            
+        Returns:
+            Dict[Tuple[str, str], Optional[Dict[str, Any]]]: Schema, or None if not available, by requested pair
+        """
+        results = {}
+        missing = []
+        for key in dict.fromkeys(schemas):
+            schema_type, version = key
+            
+            # Serve cached specific versions right away
+            if not force_update and version != "latest" and schema_type in SCHEMA_TYPES:
+                schema = self.cache.load_schema(schema_type, version if version.startswith('v') else f"v{version}")
+                if schema:
+                    results[key] = schema
+                    continue
+            missing.append(key)
+        
+        if len(missing) > 1:
+            with ThreadPoolExecutor(max_workers=min(len(missing), MAX_CONCURRENT_DOWNLOADS)) as executor:
+                fetched = list(executor.map(lambda key: self.get_schema(key[0], key[1], force_update), missing))
+        else:
+            fetched = [self.get_schema(schema_type, version, force_update) for schema_type, version in missing]
+        results.update(zip(missing, fetched))
+        return results
+    
+    def _load_latest_schema(self, schema_type: str) -> Optional[Dict[str, Any]]:
+        """Load the latest cached schema of a schema type.
+        
+        Args:
+            schema_type (str): Type of schema ("package" or "registry")
+            
+        Returns:
+            Optional[Dict[str, Any]]: Schema as a dictionary or None if not cached
+        """
+        # First try to get the latest version number
+        latest_version = self.cache.get_latest_version(schema_type)
+        
+        # Try to load the schema from the version-specific folder first,
+        # fallback to the main folder if not found
+        schema = self.cache.load_schema(schema_type, latest_version)
+        if schema:
+            return schema
+        return self.cache.load_schema(schema_type)
+    
     def update_schemas(self, force: bool = False) -> bool:
         """Check for schema updates and download if needed.
         
+        Non-forced checks are skipped for UPDATE_CHECK_COOLDOWN seconds after the
+        previous one started, whether it succeeded or not. A failed check, such
+        as with GitHub unreachable, is therefore not retried before the cooldown
+        ends, unless forced.
+        
         Args:
-            force (bool, optional): If True, force update regardless of cache freshness. Defaults to False.
+            force (bool, optional): If True, force update regardless of cache freshness and cooldown. Defaults to False.
             
         Returns:
             bool: True if any schema was updated, False otherwise
         """
+        # Skip update if this retriever just checked, so that a stale cache with
+        # GitHub unreachable does not cost a network round trip per lookup. The
+        # check is recorded when it starts, so that lookups made while it runs,
+        # and after it failed, do not start checks of their own.
+        now = time.monotonic()
+        if (not force and self._last_update_check is not None
+                and now - self._last_update_check < UPDATE_CHECK_COOLDOWN):
+            logger.debug("Schemas checked recently, skipping update")
+            return False
+        self._last_update_check = now
+        
         # Skip update if cache is fresh and not forcing
-        if not force and self.cache.is_fresh():
+        age = None if force else self.cache.get_age()
+        if age is not None and age < DEFAULT_CACHE_TTL:
+            # Close to expiry, refresh in the background so that lookups
+            # never wait on the network while the cache is still usable
+            if age >= DEFAULT_CACHE_TTL * SOFT_TTL_RATIO:
+                self._start_background_refresh()
             logger.debug("Cache is fresh, skipping update")
             return False
             
-        # Get latest releases from GitHub
-        releases = self.fetcher.get_releases()
+        # Only one process downloads at a time, the others wait and then find
+        # the cache refreshed by it
+        checked_epoch = self.cache.get_info().get("updated_at_epoch")
+        with self.cache.update_lock():
+            if self.cache.get_info().get("updated_at_epoch") != checked_epoch and self.cache.is_fresh():
+                logger.debug("Cache refreshed by another process, skipping update")
+                return False
+            return self._download_latest_schemas()
+    
+    def _download_latest_schemas(self) -> bool:
+        """Download the latest schemas from GitHub and cache them.
+        
+        Returns:
+            bool: True if any schema was updated, False otherwise
+        """
+        # Get latest releases from GitHub, conditionally when the cached schemas
+        # can be kept as they are if nothing changed
+        cached_info = self.cache.get_info()
+        validators = {}
+        if all(self.cache.has_schema(schema_type) for schema_type in SCHEMA_TYPES if schema_type in cached_info):
+            validators = {key: cached_info[key] for key in ("etag", "last_modified") if cached_info.get(key)}
+        releases = self.fetcher.get_releases(**validators)
+        if releases is None:
+            # Not modified, the cached schemas are still the latest ones
+            refreshed_info = dict(cached_info)
+            refreshed_info["updated_at"] = datetime.now(timezone.utc).isoformat()
+            refreshed_info["updated_at_epoch"] = time.time()
+            self.cache.update_info(refreshed_info)
+            logger.debug("Schema releases not modified, cache info refreshed")
+            return False
         if not releases:
             logger.warning("Could not retrieve GitHub releases")
             return False
             
-        # Extract schema information from releases
+        # Extract schema information from releases, looking further back only
+        # while some schema type is missing and there are more releases
         schema_info = self.fetcher.extract_schema_info(releases)
+        page_releases = releases
+        page = 1
+        while (len(page_releases) >= RELEASES_PER_PAGE
+               and any(schema_type not in schema_info for schema_type in SCHEMA_TYPES)):
+            if page >= MAX_RELEASE_PAGES:
+                missing = [schema_type for schema_type in SCHEMA_TYPES if schema_type not in schema_info]
+                logger.warning(f"No release found for the {', '.join(missing)} schema in the "
+                               f"{MAX_RELEASE_PAGES * RELEASES_PER_PAGE} latest releases")
+                break
+            page += 1
+            page_releases = self.fetcher.get_releases(page=page) or []
+            releases = releases + page_releases
+            schema_info = self.fetcher.extract_schema_info(releases)
         if not schema_info:
             logger.warning("No schema information found in releases")
             return False
+        schema_info.update(self.fetcher.releases_validators)
             
         updated = False
+        refreshed = False
         
-        # Process each schema type
+        # Collect the schema URL of each schema type, with the ETag of the
+        # cached schema when it was downloaded from the same URL
+        downloads = []
+        unchanged = []
         for schema_type in SCHEMA_TYPES:
             if schema_type not in schema_info:
                 continue
@@ -115,8 +303,46 @@ class SchemaRetriever:
             if not schema_url:
                 continue
             
-            # Download schema
-            schema_data = self.fetcher.download_schema(schema_url)
+            etag = None
+            cached_entry = cached_info.get(schema_type)
+            if (isinstance(cached_entry, dict) and cached_entry.get("url") == schema_url
+                    and self.cache.has_schema(schema_type, cached_entry.get("version"))
+                    and self.cache.has_schema(schema_type)):
+                if cached_entry.get("size") is not None:
+                    # Release assets do not change for a given tag, and has_schema
+                    # verified the recorded size, so there is nothing to request
+                    unchanged.append(schema_type)
+                    continue
+                etag = cached_entry.get("etag")
+            downloads.append((schema_type, schema_url, etag))
+        
+        for schema_type in unchanged:
+            schema_info[schema_type] = dict(cached_info[schema_type])
+            refreshed = True
+        
+        # Download the schemas concurrently, they are independent of each other
+        if len(downloads) > 1:
+            with ThreadPoolExecutor(max_workers=min(len(downloads), MAX_CONCURRENT_DOWNLOADS)) as executor:
+                results = list(executor.map(self.fetcher.download_schema_content_if_modified,
+                                            [url for _, url, _ in downloads], [etag for _, _, etag in downloads]))
+        else:
+            results = [self.fetcher.download_schema_content_if_modified(url, etag) for _, url, etag in downloads]
+        
+        # Process each downloaded schema
+        for (schema_type, _, _), (modified, content, etag) in zip(downloads, results):
+            if not modified:
+                # The cached files are still the latest ones, keep their recorded information
+                schema_info[schema_type] = dict(cached_info[schema_type])
+                refreshed = True
+                continue
+            if content is None:
+                continue
+            # Parse once to reject invalid downloads, the file keeps the content as received
+            try:
+                schema_data = json.loads(content)
+            except ValueError as e:
+                logger.error(f"Error parsing downloaded {schema_type} schema: {e}")
+                continue
             if not schema_data:
                 continue
             
@@ -126,22 +352,166 @@ class SchemaRetriever:
             # Save to cache - both in the version-specific folder and main folder
             if version:
                 # Save to version-specific folder
-                self.cache.save_schema(schema_type, schema_data, version)
+                if not self.cache.save_schema(schema_type, schema_data, version, content=content):
+                    continue
                 
-                # Also save to main folder (no version) for backward compatibility
-                if self.cache.save_schema(schema_type, schema_data):
+                # Also copy to main folder (no version) for backward compatibility
+                if self.cache.copy_schema(schema_type, version):
                     updated = True
+                    # Both files hold the same content, record it to detect corruption
+                    schema_info[schema_type].update(self.cache.get_schema_digest(schema_type) or {})
+                    if etag:
+                        schema_info[schema_type]["etag"] = etag
                     logger.info(f"Updated {schema_type} schema to version {version}")
         
-        # Update cache info if any schema was updated
-        if updated:
+        # Update cache info if any schema was updated or confirmed unchanged
+        if updated or refreshed:
             self.cache.update_info(schema_info)
             
         return updated
+    
+    def _start_background_refresh(self) -> None:
+        """Refresh the schemas on a daemon thread unless a refresh is already running.
+        
+        Attempts are spaced by BACKGROUND_REFRESH_INTERVAL so that an unreachable
+        GitHub does not cause a new attempt on every lookup.
+        """
+        with self._refresh_lock:
+            now = time.monotonic()
+            if self._refreshing or (self._last_refresh_attempt is not None
+                                    and now - self._last_refresh_attempt < BACKGROUND_REFRESH_INTERVAL):
+                return
+            self._refreshing = True
+            self._last_refresh_attempt = now
+        
+        logger.debug("Schema cache close to expiry, refreshing in the background")
+        threading.Thread(target=self._background_refresh, name="hatch-schema-refresh", daemon=True).start()
+    
+    def _background_refresh(self) -> None:
+        """Run a forced schema update and release the background refresh slot."""
+        try:
+            self.update_schemas(force=True)
+        except Exception as e:
+            # Nothing can handle errors raised on the refresh thread, log them instead
+            logger.warning(f"Background schema refresh failed: {e}")
+        finally:
+            with self._refresh_lock:
+                self._refreshing = False
+
+
+# Default instance used by the helper functions, created on first use so that
+# importing the module does not touch the cache directory
+_default_retriever: Optional[SchemaRetriever] = None
+_default_retriever_lock = threading.Lock()
 
 
-# Create a default instance for easier imports
-schema_retriever = SchemaRetriever()
+def _get_default_retriever() -> SchemaRetriever:
+    """Get the default schema retriever, creating it on first use.
+    
+    Returns:
+        SchemaRetriever: The default schema retriever
+    """
+    global _default_retriever
+    if _default_retriever is None:
+        with _default_retriever_lock:
+            if _default_retriever is None:
+                _default_retriever = SchemaRetriever()
+    return _default_retriever
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve the default `schema_retriever` instance lazily for easier imports.
+    
+    Args:
+        name (str): Name of the module attribute
+        
+    Returns:
+        Any: The default schema retriever for `schema_retriever`
+        
+    Raises:
+        AttributeError: For any other missing attribute
+    """
+    if name == "schema_retriever":
+        return _get_default_retriever()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+# Schemas returned by the helper functions, keyed by (schema_type, version),
+# together with the time they were retrieved
+_schema_memo: Dict[Tuple[str, str], Tuple[float, Dict[str, Any]]] = {}
+
+
+def _get_memoized_schema(schema_type: str, version: str, force_update: bool) -> Optional[Dict[str, Any]]:
+    """Get a schema through the default retriever, at most once per process.
+    
+    Every validation asks for its schema, so the result is kept in memory
+    instead of being read from the cache directory each time. Specific versions
+    never change; "latest" is looked up again once the cache TTL has passed.
+    
+    Args:
+        schema_type (str): Type of schema ("package" or "registry")
+        version (str): Version of the schema, or "latest"
+        force_update (bool): If True, bypass the memo and force a check for updates
+        
+    Returns:
+        Optional[Dict[str, Any]]: The schema as a dictionary, or None if not available
+    """
+    key = (schema_type, version)
+    if not force_update:
+        entry = _schema_memo.get(key)
+        if entry is not None and (version != "latest" or time.time() - entry[0] < DEFAULT_CACHE_TTL):
+            return entry[1]
+    
+    schema = _get_default_retriever().get_schema(schema_type, version, force_update)
+    if schema is not None:
+        _schema_memo[key] = (time.time(), schema)
+    return schema
+
+
+# Compiled validators by (schema_type, version), together with the schema they were built from
+_validator_memo: Dict[Tuple[str, str], Tuple[Dict[str, Any], Any]] = {}
+
+
+def _get_memoized_validator(schema_type: str, version: str, force_update: bool) -> Optional[Any]:
+    """Get a compiled validator for a schema, built once per retrieved schema.
+    
+    The schema is checked against its metaschema when the validator is built,
+    and the validator is built again only when a different schema is retrieved.
+    
+    Args:
+        schema_type (str): Type of schema ("package" or "registry")
+        version (str): Version of the schema, or "latest"
+        force_update (bool): If True, force a check for schema updates
+        
+    Returns:
+        Optional[Any]: The jsonschema validator, or None if the schema is not available
+        
+    Raises:
+        jsonschema.exceptions.SchemaError: If the schema itself is invalid
+    """
+    schema = _get_memoized_schema(schema_type, version, force_update)
+    if not schema:
+        return None
+    
+    key = (schema_type, version)
+    entry = _validator_memo.get(key)
+    if entry is not None and entry[0] is schema:
+        return entry[1]
+    
+    validator_cls = jsonschema.validators.validator_for(schema)
+    validator_cls.check_schema(schema)
+    validator = validator_cls(schema)
+    _validator_memo[key] = (schema, validator)
+    return validator
+
+
+def clear_schema_cache() -> None:
+    """Forget the schemas and validators kept in memory by the helper functions.
+    
+    The next lookups go through the default retriever again. The cache
+    directory itself is left untouched.
+    """
+    _schema_memo.clear()
+    _validator_memo.clear()
 
 
 def get_package_schema(version: str = "latest", force_update: bool = False) -> Optional[Dict[str, Any]]:
@@ -154,7 +524,7 @@ def get_package_schema(version: str = "latest", force_update: bool = False) -> O
     Returns:
         Optional[Dict[str, Any]]: The package schema as a dictionary, or None if not available
     """
-    return schema_retriever.get_schema("package", version, force_update)
+    return _get_memoized_schema("package", version, force_update)
 
 
 def get_registry_schema(version: str = "latest", force_update: bool = False) -> Optional[Dict[str, Any]]:
@@ -167,7 +537,39 @@ def get_registry_schema(version: str = "latest", force_update: bool = False) ->
     Returns:
         Optional[Dict[str, Any]]: The registry schema as a dictionary, or None if not available
     """
-    return schema_retriever.get_schema("registry", version, force_update)
+    return _get_memoized_schema("registry", version, force_update)
+
+
+def get_package_validator(version: str = "latest", force_update: bool = False) -> Optional[Any]:
+    """Helper function to get a compiled validator for the package schema.
+    
+    Args:
+        version (str, optional): Version of the schema, or "latest". Defaults to "latest".
+        force_update (bool, optional): If True, force a check for updates. Defaults to False.
+        
+    Returns:
+        Optional[Any]: The package schema validator, or None if the schema is not available
+        
+    Raises:
+        jsonschema.exceptions.SchemaError: If the package schema itself is invalid
+    """
+    return _get_memoized_validator("package", version, force_update)
+
+
+def get_registry_validator(version: str = "latest", force_update: bool = False) -> Optional[Any]:
+    """Helper function to get a compiled validator for the registry schema.
+    
+    Args:
+        version (str, optional): Version of the schema, or "latest". Defaults to "latest".
+        force_update (bool, optional): If True, force a check for updates. Defaults to False.
+        
+    Returns:
+        Optional[Any]: The registry schema validator, or None if the schema is not available
+        
+    Raises:
+        jsonschema.exceptions.SchemaError: If the registry schema itself is invalid
+    """
+    return _get_memoized_validator("registry", version, force_update)
 
 
 # If run as script, perform a test
@@ -178,7 +580,7 @@ if __name__ == "__main__":
     print("Testing schema retriever...")
     
     # Force update of schemas
-    updated = schema_retriever.update_schemas(force=True)
+    updated = _get_default_retriever().update_schemas(force=True)
     print(f"Schema update forced: {'Updated' if updated else 'No update needed'}")
     
     # Load schemas
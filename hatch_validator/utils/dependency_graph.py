@@ -19,6 +19,12 @@ class DependencyGraph:
     
     Provides methods for building graphs, detecting cycles, and other
     graph operations that are independent of schema version.
+    
+    Lookups are cached while the graph is built through add_package and
+    add_dependency. Adding, replacing or removing entries of adjacency_list
+    directly, or appending to or removing from their dependency lists, is
+    detected and the caches are recomputed. Editing a dependency dict in
+    place is not detected.
     """
     
     def __init__(self, adjacency_list: Optional[Dict[str, List[Dict]]] = None):
@@ -30,6 +36,23 @@ class DependencyGraph:
                 with keys: name, version_constraint, resolved_version. Defaults to None.
         """
         self.adjacency_list = adjacency_list or {}
+        # Topological order kept up to date while the graph is built edge by edge
+        # (Pearce-Kelly), so acyclic graphs need no full search in detect_cycles.
+        # Graphs seeded from an existing adjacency list start without an order
+        # and fall back to the batch DFS.
+        self._order: Optional[Dict[str, int]] = None if self.adjacency_list else {}
+        self._reverse: Dict[str, Set[str]] = defaultdict(set)
+        self._has_cycle = False
+        # Names of all packages, computed on first use and dropped on changes
+        self._packages: Optional[Set[str]] = None
+        # (name, resolved_version) of the dependencies of each package, to avoid duplicates
+        self._dependency_keys: Dict[str, Set[Tuple[str, Optional[str]]]] = {}
+        # Dependency list and its length of each package as last seen by the
+        # graph, to detect changes made to adjacency_list directly
+        self._synced_list: Dict[str, List[Dict]] = self.adjacency_list
+        self._synced: Dict[str, Tuple[List[Dict], int]] = {
+            package: (deps, len(deps)) for package, deps in self.adjacency_list.items()
+        }
 
     def to_dict(self) -> Dict[str, List[Dict]]:
         """Convert the graph to a dictionary representation.
@@ -58,20 +81,28 @@ class DependencyGraph:
             package (str): The package that depends on another package.
             dependency (Dict): Dependency object with keys: name, version_constraint, resolved_version.
         """
-        if package not in self.adjacency_list:
-            self.adjacency_list[package] = []
-        
         dep_name = dependency.get("name")
         if not dep_name:
             raise ValueError("Dependency dict must contain 'name' key")
         
+        self._sync_package(package)
+        if package not in self.adjacency_list:
+            self.adjacency_list[package] = []
+            self._packages = None
+        
         # Avoid duplicates by name and resolved_version
-        existing = any(
-            d.get("name") == dep_name and d.get("resolved_version") == dependency.get("resolved_version")
-            for d in self.adjacency_list[package]
-        )
-        if not existing:
-            self.adjacency_list[package].append(dependency)
+        keys = self._dependency_keys.get(package)
+        if keys is None:
+            keys = {(d.get("name"), d.get("resolved_version")) for d in self.adjacency_list[package]}
+            self._dependency_keys[package] = keys
+        key = (dep_name, dependency.get("resolved_version"))
+        if key not in keys:
+            keys.add(key)
+            deps = self.adjacency_list[package]
+            deps.append(dependency)
+            self._synced[package] = (deps, len(deps))
+            self._packages = None
+            self._track_edge(package, dep_name)
             
     def add_package(self, package: str) -> None:
         """Add a package to the graph without dependencies.
@@ -79,8 +110,127 @@ class DependencyGraph:
         Args:
             package (str): The package name to add.
         """
+        self._sync_package(package)
         if package not in self.adjacency_list:
             self.adjacency_list[package] = []
+            self._synced[package] = (self.adjacency_list[package], 0)
+            self._packages = None
+        self._track_node(package)
+
+    def _sync_package(self, package: str) -> None:
+        """Recompute the cached state if a package was changed in adjacency_list directly.
+        
+        Only the package about to be changed is checked, so that building the
+        graph stays linear. Queries check all packages.
+        
+        Args:
+            package (str): The package name about to be changed.
+        """
+        entry = self._synced.get(package)
+        deps = self.adjacency_list.get(package)
+        if self._synced_list is not self.adjacency_list or (
+                entry is None and deps is not None) or (
+                entry is not None and (entry[0] is not deps or entry[1] != len(deps))):
+            self._resync()
+
+    def _ensure_synced(self) -> None:
+        """Recompute the cached state if adjacency_list was changed directly."""
+        adjacency_list = self.adjacency_list
+        synced = self._synced
+        if self._synced_list is adjacency_list and len(synced) == len(adjacency_list):
+            for package, deps in adjacency_list.items():
+                entry = synced.get(package)
+                if entry is None or entry[0] is not deps or entry[1] != len(deps):
+                    break
+            else:
+                return
+        self._resync()
+
+    def _resync(self) -> None:
+        """Drop the state cached from an outdated adjacency list.
+        
+        The maintained order cannot be repaired for arbitrary changes, so
+        cycles are detected with the batch DFS from then on.
+        """
+        self._order = None
+        self._reverse.clear()
+        self._has_cycle = False
+        self._packages = None
+        self._dependency_keys = {}
+        self._synced_list = self.adjacency_list
+        self._synced = {package: (deps, len(deps)) for package, deps in self.adjacency_list.items()}
+
+    def _track_node(self, package: str) -> None:
+        """Give a new package a position at the end of the maintained order.
+        
+        Args:
+            package (str): The package name to track.
+        """
+        if self._order is not None and package not in self._order:
+            self._order[package] = len(self._order)
+
+    def _track_edge(self, package: str, dep_name: str) -> None:
+        """Update the maintained topological order for a new edge.
+        
+        Only the packages ordered between the two endpoints are visited. If the
+        new edge closes a cycle, the graph is flagged and the order is no longer
+        maintained.
+        
+        Args:
+            package (str): The package that depends on dep_name.
+            dep_name (str): The name of the dependency.
+        """
+        order = self._order
+        if order is None or self._has_cycle:
+            return
+        self._track_node(package)
+        self._track_node(dep_name)
+        self._reverse[dep_name].add(package)
+        
+        if package == dep_name:
+            self._has_cycle = True
+            return
+        
+        lower, upper = order[dep_name], order[package]
+        if upper < lower:
+            # The package already comes before its dependency
+            return
+        
+        # Packages reachable from the dependency that are ordered before the package
+        forward = []
+        seen = {dep_name}
+        stack = [dep_name]
+        while stack:
+            node = stack.pop()
+            forward.append(node)
+            for dep in self.adjacency_list.get(node, []):
+                name = self._get_dependency_name(dep)
+                if name == package:
+                    self._has_cycle = True
+                    return
+                if name not in seen and order[name] < upper:
+                    seen.add(name)
+                    stack.append(name)
+        
+        # Packages reaching the package that are ordered after the dependency
+        backward = []
+        seen = {package}
+        stack = [package]
+        while stack:
+            node = stack.pop()
+            backward.append(node)
+            for parent in self._reverse.get(node, ()):
+                if parent not in seen and order[parent] > lower:
+                    seen.add(parent)
+                    stack.append(parent)
+        
+        # Reassign the affected positions so that dependents precede dependencies
+        backward.sort(key=order.__getitem__)
+        forward.sort(key=order.__getitem__)
+        affected = backward + forward
+        positions = sorted(order[node] for node in affected)
+        for node, position in zip(affected, positions):
+            order[node] = position
     
     def _get_dependency_name(self, dependency: Dict) -> str:
         """Extract dependency name from dict format.
@@ -99,67 +249,81 @@ class DependencyGraph:
         Returns:
             Set[str]: Set of all package names in the graph.
         """
-        packages = set(self.adjacency_list.keys())
-        for deps in self.adjacency_list.values():
-            for dep in deps:
-                packages.add(self._get_dependency_name(dep))
-        return packages
+        return set(self._get_packages())
     
-    def detect_cycles(self) -> Tuple[bool, List[List[str]]]:
+    def _get_packages(self) -> Set[str]:
+        """Get the shared set of all packages in the graph, computing it if needed.
+        
+        Returns:
+            Set[str]: Set of all package names in the graph, not to be modified.
+        """
+        self._ensure_synced()
+        if self._packages is None:
+            packages = set(self.adjacency_list.keys())
+            for deps in self.adjacency_list.values():
+                for dep in deps:
+                    packages.add(self._get_dependency_name(dep))
+            self._packages = packages
+        return self._packages
+    
+    def detect_cycles(self, max_cycles: Optional[int] = None) -> Tuple[bool, List[List[str]]]:
         """Detect cycles in the dependency graph using DFS.
         
         Uses depth-first search with three colors (white, gray, black) to detect
         cycles in the directed graph. Gray nodes indicate a back edge which
-        forms a cycle.
+        forms a cycle. Graphs built through add_package/add_dependency that never
+        closed a cycle are answered from the maintained order without a search.
+        
+        Args:
+            max_cycles (int, optional): Stop searching once this many cycles have
+                been found. Defaults to None, which reports every back edge.
         
         Returns:
             Tuple[bool, List[List[str]]]: A tuple containing:
                 - bool: Whether cycles were detected
                 - List[List[str]]: List of cycles found, each represented as a path
         """
+        self._ensure_synced()
+        if self._order is not None and not self._has_cycle:
+            return False, []
+        
         # Color states: 0 = white (unvisited), 1 = gray (visiting), 2 = black (visited)
         colors = defaultdict(int)
         cycles = []
         path = []
-        
-        def dfs(node: str) -> bool:
-            """Depth-first search helper function.
-            
-            Args:
-                node (str): Current node being visited.
+        adjacency_list = self.adjacency_list
+        get_name = self._get_dependency_name
+        
+        # Check all nodes to find all cycles, with an explicit stack of the
+        # dependencies left to visit so that long chains do not hit the
+        # recursion limit
+        for package in self._get_packages():
+            if colors[package] != 0:  # Not white - already visited
+                continue
+            colors[package] = 1
+            path.append(package)
+            stack = [iter(adjacency_list.get(package, ()))]
+            while stack:
+                dep = next(stack[-1], None)
+                if dep is None:
+                    # Mark as black (visited)
+                    colors[path.pop()] = 2
+                    stack.pop()
+                    continue
                 
-            Returns:
-                bool: True if a cycle is found from this node.
-            """
-            if colors[node] == 1:  # Gray - back edge found, cycle detected
-                # Find the cycle in the current path
-                cycle_start = path.index(node)
-                cycle = path[cycle_start:] + [node]
-                cycles.append(cycle)
-                return True
-            
-            if colors[node] == 2:  # Black - already processed
-                return False
-            
-            # Mark as gray (visiting)
-            colors[node] = 1
-            path.append(node)
-              # Visit all dependencies
-            for dep in self.adjacency_list.get(node, []):
-                dep_name = self._get_dependency_name(dep)
-                if dfs(dep_name):
-                    # Continue searching for more cycles instead of returning immediately
-                    pass
-            
-            # Mark as black (visited)
-            colors[node] = 2
-            path.pop()
-            return False
-        
-        # Check all nodes to find all cycles
-        for package in self.get_all_packages():
-            if colors[package] == 0:  # White - unvisited
-                dfs(package)
+                dep_name = get_name(dep)
+                color = colors[dep_name]
+                if color == 1:  # Gray - back edge found, cycle detected
+                    # Find the cycle in the current path
+                    cycle_start = path.index(dep_name)
+                    cycles.append(path[cycle_start:] + [dep_name])
+                    if max_cycles is not None and len(cycles) >= max_cycles:
+                        return True, cycles
+                elif color == 0:
+                    # Mark as gray (visiting)
+                    colors[dep_name] = 1
+                    path.append(dep_name)
+                    stack.append(iter(adjacency_list.get(dep_name, ())))
         
         return len(cycles) > 0, cycles
     
@@ -170,21 +334,17 @@ class DependencyGraph:
         It is possible users may expect the reverse order (dependencies before dependents),
         but this implementation follows the standard convention. Simply reverse the result
         if the reverse order is desired.
-        Only works for acyclic graphs.
+        Only works for acyclic graphs: packages on a cycle never lose all their
+        incoming edges, so a sort leaving packages out reveals a cycle.
         
         Returns:
             Tuple[bool, List[str]]: A tuple containing:
                 - bool: Whether the sort was successful (graph is acyclic)
                 - List[str]: Topologically sorted list of packages
         """
-        # First check if the graph has cycles
-        has_cycles, _ = self.detect_cycles()
-        if has_cycles:
-            return False, []
-        
         # Kahn's algorithm
         in_degree = defaultdict(int)
-        all_packages = self.get_all_packages()
+        all_packages = self._get_packages()
         
         # Calculate in-degrees
         for package in all_packages:
@@ -209,7 +369,9 @@ class DependencyGraph:
                 if in_degree[dep_name] == 0:
                     queue.append(dep_name)
         
-        return len(result) == len(all_packages), result
+        if len(result) != len(all_packages):
+            return False, []
+        return True, result
     
     def find_dependency_path(self, start: str, target: str) -> Optional[List[str]]:
         """Find a path from start package to target package.
@@ -226,19 +388,27 @@ class DependencyGraph:
         if start == target:
             return [start]
         
-        queue = deque([(start, [start])])
-        visited = {start}        
+        # Each visited package points back to the package it was reached from,
+        # the path is only built once the target is found
+        queue = deque([start])
+        parents: Dict[str, Optional[str]] = {start: None}
         while queue:
-            current, path = queue.popleft()
+            current = queue.popleft()
             
             for dep in self.adjacency_list.get(current, []):
                 dep_name = self._get_dependency_name(dep)
                 if dep_name == target:
-                    return path + [dep_name]
+                    path = [dep_name]
+                    node = current
+                    while node is not None:
+                        path.append(node)
+                        node = parents[node]
+                    path.reverse()
+                    return path
                 
-                if dep_name not in visited:
-                    visited.add(dep_name)
-                    queue.append((dep_name, path + [dep_name]))
+                if dep_name not in parents:
+                    parents[dep_name] = current
+                    queue.append(dep_name)
         
         return None      
     
@@ -313,6 +483,9 @@ class DependencyGraph:
     def get_all_dependencies(self, package: str) -> Set[str]:
         """Get all transitive dependencies of a package.
         
+        Only the packages reachable from the given package are searched, so
+        cycles elsewhere in the graph do not prevent the computation.
+        
         Args:
             package (str): Package name to get all dependencies for.
             
@@ -320,25 +493,30 @@ class DependencyGraph:
             Set[str]: Set of all transitive dependencies.
             
         Raises:
-            DependencyGraphError: If the graph contains cycles.
+            DependencyGraphError: If a cycle is reachable from the package.
         """
-        has_cycles, cycles = self.detect_cycles()
-        if has_cycles:
-            raise DependencyGraphError(f"Cannot compute transitive dependencies: graph contains cycles: {cycles}")
-        
-        visited = set()
-        stack = [package]
-        
+        # Color states: 1 = gray (visiting), 2 = black (visited)
+        colors = {package: 1}
+        path = [package]
+        stack = [iter(self.adjacency_list.get(package, ()))]
         while stack:
-            current = stack.pop()
-            if current in visited:
+            dep = next(stack[-1], None)
+            if dep is None:
+                colors[path.pop()] = 2
+                stack.pop()
                 continue
-            visited.add(current)            
-            for dep in self.adjacency_list.get(current, []):
-                dep_name = self._get_dependency_name(dep)
-                if dep_name not in visited:
-                    stack.append(dep_name)
+            
+            dep_name = self._get_dependency_name(dep)
+            color = colors.get(dep_name)
+            if color == 1:
+                cycle = path[path.index(dep_name):] + [dep_name]
+                raise DependencyGraphError(
+                    f"Cannot compute transitive dependencies: graph contains cycles: {[cycle]}")
+            if color is None:
+                colors[dep_name] = 1
+                path.append(dep_name)
+                stack.append(iter(self.adjacency_list.get(dep_name, ())))
         
         # Remove the starting package from the result
-        visited.discard(package)
-        return visited
+        del colors[package]
+        return set(colors)
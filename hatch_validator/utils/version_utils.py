@@ -5,6 +5,7 @@ constraints that are independent of specific schema versions.
 """
 
 import re
+from functools import lru_cache
 from typing import Dict, List, Set, Tuple, Optional
 from packaging import version
 from packaging.specifiers import SpecifierSet, InvalidSpecifier
@@ -15,6 +16,43 @@ class VersionConstraintError(Exception):
     pass
 
 
+@lru_cache(maxsize=2048)
+def _parse_version(version_str: str) -> Tuple[Optional[version.Version], Optional[str]]:
+    """Parse a version string, caching the result per string.
+    
+    Args:
+        version_str (str): Version string to parse.
+        
+    Returns:
+        Tuple[Optional[version.Version], Optional[str]]: Parsed version, or None
+            and an error message if the string is not a valid version.
+    """
+    try:
+        return version.Version(version_str), None
+    except version.InvalidVersion as e:
+        return None, f"Invalid version format: {e}"
+
+
+@lru_cache(maxsize=2048)
+def _parse_specifier(constraint: str) -> Tuple[Optional[SpecifierSet], Optional[str]]:
+    """Parse a constraint string, caching the result per string.
+    
+    The same constraints recur across the dependencies of many packages, so
+    each distinct string is only parsed once.
+    
+    Args:
+        constraint (str): Version constraint string to parse.
+        
+    Returns:
+        Tuple[Optional[SpecifierSet], Optional[str]]: Parsed specifier set, or
+            None and an error message if the constraint is invalid.
+    """
+    try:
+        return SpecifierSet(constraint), None
+    except InvalidSpecifier as e:
+        return None, f"Invalid constraint format: {e}"
+
+
 class VersionConstraintValidator:
     """Utility class for validating version constraints.
     
@@ -41,12 +79,24 @@ class VersionConstraintValidator:
         if not version_str or not isinstance(version_str, str):
             return False, "Version must be a non-empty string"
         
-        try:
-            # Use packaging library to validate version
-            version.Version(version_str)
-            return True, None
-        except version.InvalidVersion as e:
-            return False, f"Invalid version format: {e}"
+        _, error = _parse_version(version_str)
+        return error is None, error
+    
+    @staticmethod
+    def parse_version(version_str: str) -> Optional[version.Version]:
+        """Parse a version string, for comparing and sorting versions.
+        
+        Parsed versions are cached per string.
+        
+        Args:
+            version_str (str): Version string to parse (e.g., "1.2.3").
+            
+        Returns:
+            Optional[version.Version]: Parsed version, or None if the version is invalid.
+        """
+        if not version_str or not isinstance(version_str, str):
+            return None
+        return _parse_version(version_str)[0]
     
     @staticmethod
     def validate_constraint(constraint: str) -> Tuple[bool, Optional[str]]:
@@ -65,12 +115,8 @@ class VersionConstraintValidator:
         if not constraint or not isinstance(constraint, str):
             return False, "Constraint must be a non-empty string"
         
-        try:
-            # Use packaging library to validate constraint
-            SpecifierSet(constraint)
-            return True, None
-        except InvalidSpecifier as e:
-            return False, f"Invalid constraint format: {e}"
+        _, error = _parse_specifier(constraint)
+        return error is None, error
     
     @staticmethod
     def is_version_compatible(version_str: str, constraint: str) -> Tuple[bool, Optional[str]]:
@@ -95,8 +141,8 @@ class VersionConstraintValidator:
             return False, f"Invalid constraint: {constraint_error}"
         
         try:
-            ver = version.Version(version_str)
-            spec = SpecifierSet(constraint)
+            ver, _ = _parse_version(version_str)
+            spec, _ = _parse_specifier(constraint)
             is_compatible = ver in spec
             return is_compatible, None
         except Exception as e:
@@ -173,6 +173,13 @@ class TestDependencyGraph(unittest.TestCase):
         self.assertTrue(has_cycles, "Complex graph with multiple cycles should detect cycles")
         self.assertGreaterEqual(len(cycles), 1, "Complex graph should detect at least one cycle")
     
+    def test_detect_cycles_stops_at_max_cycles(self):
+        """Test that cycle detection stops once max_cycles cycles are found."""
+        has_cycles, cycles = self.complex_cyclic.detect_cycles(max_cycles=1)
+        self.assertTrue(has_cycles, "Complex cyclic graph should detect cycles")
+        self.assertEqual(len(cycles), 1, "Only one cycle should be reported when max_cycles=1")
+        self.assertEqual(cycles[0][0], cycles[0][-1], "Reported cycle should start and end on the same package")
+    
     def test_topological_sort_acyclic(self):
         """Test topological sort on acyclic graph."""
         success, sorted_packages = self.simple_acyclic.topological_sort()
@@ -225,6 +232,15 @@ class TestDependencyGraph(unittest.TestCase):
             ['pkg2', 'pkg3'],
             "Package pkg1 should have dependencies ['pkg2', 'pkg3'] after adding them"
         )
+        
+        graph.add_dependency('pkg1', {"name": "pkg2", "version_constraint": ">=1.0", "resolved_version": None})
+        graph.add_dependency('pkg1', {"name": "pkg2", "version_constraint": None, "resolved_version": "1.0.0"})
+        self.assertEqual(graph.get_direct_dependencies('pkg1'), ['pkg2', 'pkg3', 'pkg2'],
+                         "Dependencies should only be deduplicated by name and resolved version")
+        
+        seeded = DependencyGraph({'A': [{"name": "B", "version_constraint": None, "resolved_version": None}]})
+        seeded.add_dependency('A', {"name": "B", "version_constraint": None, "resolved_version": None})
+        self.assertEqual(seeded.get_direct_dependencies('A'), ['B'], "Seeded dependencies should not be duplicated")
     
     def test_add_package(self):
         """Test adding a package without dependencies."""
@@ -241,6 +257,20 @@ class TestDependencyGraph(unittest.TestCase):
         packages = self.simple_acyclic.get_all_packages()
         expected = {'A', 'B', 'C'}
         self.assertEqual(packages, expected, "Should return all packages in the graph including dependencies")
+        
+        packages.add('D')
+        self.assertEqual(self.simple_acyclic.get_all_packages(), expected, "Returned set should not be shared")
+        graph = DependencyGraph()
+        graph.add_package('A')
+        self.assertEqual(graph.get_all_packages(), {'A'})
+        graph.add_dependency('A', {'name': 'B'})
+        self.assertEqual(graph.get_all_packages(), {'A', 'B'}, "Added dependencies should be listed")
+        graph.adjacency_list['C'] = [{'name': 'D'}]
+        self.assertEqual(graph.get_all_packages(), {'A', 'B', 'C', 'D'}, "Packages added directly should be listed")
+        success, order = graph.topological_sort()
+        self.assertTrue(success)
+        self.assertEqual(set(order), {'A', 'B', 'C', 'D'}, "Sort should include packages added directly")
+        self.assertLess(order.index('C'), order.index('D'))
     
     def test_get_direct_dependencies(self):
         """Test getting direct dependencies of a package."""
@@ -261,6 +291,17 @@ class TestDependencyGraph(unittest.TestCase):
         with self.assertRaises(DependencyGraphError):
             self.simple_cyclic.get_all_dependencies('A')
     
+    def test_get_all_dependencies_ignores_unreachable_cycles(self):
+        """Test that cycles not reachable from the package do not prevent the computation."""
+        with self.assertRaises(DependencyGraphError, msg="Cycles reachable from the package should raise"):
+            self.complex_cyclic.get_all_dependencies('D')
+        graph = DependencyGraph({
+            'app': [{"name": "lib", "version_constraint": None, "resolved_version": None}],
+            'X': [{"name": "Y", "version_constraint": None, "resolved_version": None}],
+            'Y': [{"name": "X", "version_constraint": None, "resolved_version": None}]
+        })
+        self.assertEqual(graph.get_all_dependencies('app'), {'lib'})
+    
     def test_from_dependency_dict(self):
         """Test creating graph from dependency dictionary."""
         deps = {
@@ -297,6 +338,56 @@ class TestDependencyGraph(unittest.TestCase):
         self.assertTrue(has_cycles, "Graph with self-dependency should detect cycle")
         self.assertEqual(len(cycles), 1, "Self-dependency should create exactly one cycle")
     
+    def test_long_chain_cycle_detection(self):
+        """Test that cycle detection handles chains longer than the recursion limit."""
+        length = 5000
+        adjacency = {f"p{i}": [{"name": f"p{i + 1}", "version_constraint": None, "resolved_version": None}]
+                     for i in range(length)}
+        self.assertFalse(DependencyGraph(dict(adjacency)).detect_cycles()[0], "Long acyclic chain should have no cycles")
+        
+        adjacency[f"p{length}"] = [{"name": "p0", "version_constraint": None, "resolved_version": None}]
+        has_cycles, cycles = DependencyGraph(adjacency).detect_cycles()
+        self.assertTrue(has_cycles, "Closing the chain should be detected as a cycle")
+        self.assertEqual(len(cycles[0]), length + 2, "Cycle should span the whole chain")
+    
+    def test_incremental_cycle_detection_matches_batch(self):
+        """Test that graphs built edge by edge report the same cycles as the batch search."""
+        edge_sets = [
+            [('A', 'B'), ('B', 'C'), ('A', 'C')],
+            [('C', 'D'), ('A', 'B'), ('B', 'C'), ('D', 'E')],
+            [('A', 'B'), ('B', 'C'), ('C', 'A')],
+            [('D', 'E'), ('B', 'C'), ('C', 'D'), ('E', 'B')],
+            [('A', 'A')],
+        ]
+        for edges in edge_sets:
+            graph = DependencyGraph()
+            adjacency = {}
+            for package, dep_name in edges:
+                dep = {"name": dep_name, "version_constraint": None, "resolved_version": None}
+                graph.add_dependency(package, dep)
+                adjacency.setdefault(package, []).append(dep)
+            batch_has_cycles, _ = DependencyGraph(adjacency).detect_cycles()
+            has_cycles, cycles = graph.detect_cycles()
+            self.assertEqual(has_cycles, batch_has_cycles, f"Cycle detection mismatch for edges {edges}")
+            self.assertEqual(bool(cycles), has_cycles, "Detected cycles should be reported")
+    
+    def test_cycle_detection_after_direct_changes(self):
+        """Test that cycles added to the adjacency list directly are detected."""
+        graph = DependencyGraph()
+        graph.add_dependency('A', {"name": "B", "version_constraint": None, "resolved_version": None})
+        self.assertFalse(graph.detect_cycles()[0])
+        graph.adjacency_list['B'] = [{"name": "A", "version_constraint": None, "resolved_version": None}]
+        self.assertTrue(graph.detect_cycles()[0], "Package added directly should be seen")
+        
+        graph = DependencyGraph()
+        graph.add_dependency('A', {"name": "B", "version_constraint": None, "resolved_version": None})
+        graph.add_dependency('B', {"name": "C", "version_constraint": None, "resolved_version": None})
+        self.assertFalse(graph.detect_cycles()[0])
+        graph.adjacency_list['B'].append({"name": "A", "version_constraint": None, "resolved_version": None})
+        self.assertTrue(graph.detect_cycles()[0], "Dependency appended directly should be seen")
+        graph.add_dependency('C', {"name": "D", "version_constraint": None, "resolved_version": None})
+        self.assertTrue(graph.detect_cycles()[0], "Graph built further should keep the cycle")
+    
     def test_complex_path_finding(self):
         """Test path finding in complex graph."""
         path = self.complex_acyclic.find_dependency_path('app', 'math')
@@ -4,8 +4,15 @@
 This module tests the RegistryService API for access operations on a mock registry
 following the v1.1.0 schema.
 """
+import json
+import os
+import sys
+import tempfile
 import unittest
-from hatch_validator.registry.registry_service import RegistryService, RegistryError
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+from hatch_validator.registry.registry_accessor_factory import RegistryAccessorFactory
+from hatch_validator.registry.registry_service import RegistryService, RegistryError, get_registry_service
 
 # Minimal mock registry data following v1.1.0 schema
 MOCK_REGISTRY_V110 = {
@@ -139,6 +146,33 @@ class TestRegistryServiceV110(unittest.TestCase):
         deps3 = self.service.get_package_dependencies("Hatch-Dev:util_pkg", version="0.1.0")
         self.assertEqual(deps, deps3)
 
+    def test_get_package_dependencies_applies_diffs(self):
+        registry = {
+            "registry_schema_version": "1.1.0",
+            "repositories": [{"name": "Repo", "packages": [{"name": "pkg", "versions": [
+                {"version": "1.0.0", "hatch_dependencies_added": [{"name": "a"}, {"name": "b", "version_constraint": ">=1"}]},
+                {"version": "1.1.0", "hatch_dependencies_added": [{"name": "b", "version_constraint": ">=3"}],
+                 "hatch_dependencies_removed": ["a"],
+                 "hatch_dependencies_modified": [{"name": "b", "version_constraint": ">=2"}, {"name": "missing"}]},
+                {"version": "2.0.0", "hatch_dependencies_added": [{"name": "c"}]}
+            ]}]}]
+        }
+        service = RegistryService(registry)
+        names = lambda version: [(dep["name"], dep.get("version_constraint"))
+                                 for dep in service.get_package_dependencies("pkg", version)["dependencies"]]
+        expected = [("b", ">=2"), ("b", ">=3"), ("c", None)]
+        self.assertEqual(names("2.0.0"), expected, "Modifications should replace only the first dependency of a name")
+        self.assertEqual(names(None), names("2.0.0"), "Latest version should be used by default")
+        # The diffs of every version are applied, whatever the requested version
+        self.assertEqual(names("1.0.0"), expected)
+        self.assertEqual(service.get_package_dependencies("pkg", "1.0.0")["version"], "1.0.0")
+        
+        service.get_package_dependencies("pkg", "2.0.0")["dependencies"].clear()
+        registry["repositories"][0]["packages"][0]["versions"][2]["hatch_dependencies_added"].append({"name": "d"})
+        self.assertEqual(names("2.0.0"), expected, "Reconstructions are cached until cleared")
+        service.clear_cache()
+        self.assertEqual(names("2.0.0"), expected + [("d", None)])
+
     def test_get_package_uri(self):
         uri = self.service.get_package_uri("base_pkg_1", "1.0.0")
         self.assertEqual(uri, "https://example.com/hatch-dev/base_pkg_1/1.0.0")
@@ -159,6 +193,18 @@ class TestRegistryServiceV110(unittest.TestCase):
         v3 = self.service.find_compatible_version("Hatch-Dev:base_pkg_1", ">=1.0.0")
         self.assertIn(v3, ["1.0.0", "1.1.0"])
 
+    def test_find_compatible_version_orders_versions(self):
+        registry = {
+            "registry_schema_version": "1.1.0",
+            "repositories": [{"name": "Repo", "packages": [{"name": "pkg", "versions": [
+                {"version": v} for v in ["1.2.0", "1.10.0", "2.0.0", "2.0.0rc1", "not-a-version"]
+            ]}]}]
+        }
+        service = RegistryService(registry)
+        self.assertEqual(service.find_compatible_version("pkg", "<2.0"), "1.10.0")
+        self.assertEqual(service.find_compatible_version("pkg", ">=1.0"), "2.0.0")
+        self.assertIsNone(service.find_compatible_version("pkg", ">=3.0"))
+
     def test_has_repository_name(self):
         self.assertTrue(self.service.has_repository_name("Hatch-Dev:base_pkg_1"))
         self.assertFalse(self.service.has_repository_name("base_pkg_1"))
@@ -183,5 +229,132 @@ class TestRegistryServiceV110(unittest.TestCase):
     def test_get_schema_version(self):
         self.assertEqual(self.service.get_schema_version(), "1.1.0")
 
+    def test_lookups_across_repositories(self):
+        registry = {
+            "registry_schema_version": "1.1.0",
+            "repositories": [
+                {"name": "First", "packages": [{"name": "shared", "versions": [{"version": "1.0.0"}]}]},
+                {"name": "Second", "packages": [{"name": "shared", "versions": [{"version": "2.0.0"}]},
+                                                {"name": "extra", "versions": [{"version": "0.1.0"}]}]}
+            ]
+        }
+        service = RegistryService(registry)
+        self.assertEqual(service.get_package_versions("shared"), ["1.0.0"], "First repository should win")
+        self.assertEqual(service.get_package_versions("shared", "Second"), ["2.0.0"])
+        self.assertEqual(service.get_package_versions("Second:extra"), ["0.1.0"])
+        self.assertFalse(service.package_exists("extra", "First"))
+        self.assertIsNone(service.get_package_by_repo("First", "extra"))
+        
+        names = service.get_all_package_names()
+        names.append("modified")
+        self.assertEqual(service.get_all_package_names(), ["shared", "shared", "extra"], "Cached names should not be shared")
+        registry["repositories"][0]["packages"].append({"name": "late", "versions": [{"version": "3.0.0"}]})
+        self.assertTrue(service.package_exists("late"), "Packages added in place should be seen")
+        self.assertIn("late", service.get_all_package_names("First"))
+        registry["repositories"].append({"name": "Third", "packages": []})
+        self.assertEqual(service.list_repositories(), ["First", "Second", "Third"])
+        self.assertTrue(service.repository_exists("Third"))
+        
+        self.assertEqual(service.find_compatible_version("late", ">=3.0.0"), "3.0.0")
+        registry["repositories"][0]["packages"][1]["versions"].append({"version": "3.1.0"})
+        self.assertEqual(service.get_package_versions("late"), ["3.0.0", "3.1.0"], "Versions added in place should be seen")
+        self.assertEqual(service.find_compatible_version("late", ">=3.0.0"), "3.1.0")
+        registry["repositories"][0]["packages"][1]["versions"][1]["version"] = "3.2.0"
+        self.assertEqual(service.get_package_versions("late"), ["3.0.0", "3.1.0"], "Edited entries are cached until cleared")
+        service.clear_cache()
+        self.assertEqual(service.get_package_versions("late"), ["3.0.0", "3.2.0"])
+
+    def test_accessor_shared_across_threads(self):
+        accessor = RegistryAccessorFactory.create_accessor_for_data(MOCK_REGISTRY_V110)
+        registries = [
+            {"registry_schema_version": "1.1.0",
+             "repositories": [{"name": f"Repo{i}", "packages": [
+                 {"name": "pkg", "versions": [{"version": f"{i}.{minor}.0"} for minor in range(3)]}]}]}
+            for i in range(4)
+        ]
+        
+        def query(i):
+            registry = registries[i % len(registries)]
+            expected = (i % len(registries), [f"{i % len(registries)}.{minor}.0" for minor in range(3)])
+            for _ in range(200):
+                result = (int(accessor.find_compatible_version(registry, "pkg", ">=0.0.0").split(".")[0]),
+                          accessor.get_package_versions(registry, "pkg"))
+                if result != expected:
+                    return result
+            return expected
+        
+        interval = sys.getswitchinterval()
+        # Switch threads often, so that lookups interleave
+        sys.setswitchinterval(1e-6)
+        try:
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                results = list(executor.map(query, range(8)))
+        finally:
+            sys.setswitchinterval(interval)
+        for i, result in enumerate(results):
+            expected = (i % len(registries), [f"{i % len(registries)}.{minor}.0" for minor in range(3)])
+            self.assertEqual(result, expected, "Lookups of other threads should not be mixed in")
+
+    def test_load_registry_from_file(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "registry.json")
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(MOCK_REGISTRY_V110, f)
+            service = RegistryService()
+            service.load_registry_from_file(path)
+            self.assertEqual(service.get_registry_data(), MOCK_REGISTRY_V110)
+            
+            with open(path, "wb") as f:
+                f.write(b'{"registry_schema_version": "1.1.0", \xff')
+            with self.assertRaises(RegistryError):
+                service.load_registry_from_file(path)
+
+    def test_accessor_selected_once_per_schema_version(self):
+        RegistryService(MOCK_REGISTRY_V110)
+        with mock.patch.object(RegistryAccessorFactory, "create_accessor_chain",
+                               wraps=RegistryAccessorFactory.create_accessor_chain) as create_chain:
+            first = RegistryService(dict(MOCK_REGISTRY_V110))
+            second = RegistryService(dict(MOCK_REGISTRY_V110))
+            self.assertIsNone(RegistryAccessorFactory.create_accessor_for_data({"registry_schema_version": "0.9.0"}))
+            self.assertIsNone(RegistryAccessorFactory.create_accessor_for_data({"registry_schema_version": "0.9.0"}))
+        self.assertEqual(create_chain.call_count, 1, "Known schema versions should not walk the chain")
+        self.assertIsNot(first._accessor, second._accessor, "Each service should get its own accessor")
+        self.assertFalse(hasattr(first._accessor, "__dict__"), "Accessors should not carry an instance dict")
+        self.assertEqual(first.get_package_versions("base_pkg_1"), ["1.0.0", "1.1.0"])
+
+    def test_accessor_for_data_same_on_repeated_calls(self):
+        V110Accessor = type(RegistryService(MOCK_REGISTRY_V110)._accessor)
+        
+        class NewerAccessor(V110Accessor):
+            __slots__ = ()
+            
+            def can_handle(self, registry_data):
+                return registry_data.get('registry_schema_version', '').startswith('1.2.')
+        
+        versions = RegistryAccessorFactory.get_supported_versions()
+        with mock.patch.dict(RegistryAccessorFactory._accessor_registry), \
+                mock.patch.object(RegistryAccessorFactory, "_version_order", versions), \
+                mock.patch.dict(RegistryAccessorFactory._accessor_by_schema_version):
+            RegistryAccessorFactory.register_accessor('1.2.0', NewerAccessor)
+            first = RegistryAccessorFactory.create_accessor_for_data(MOCK_REGISTRY_V110)
+            second = RegistryAccessorFactory.create_accessor_for_data(MOCK_REGISTRY_V110)
+        self.assertIs(type(first), V110Accessor)
+        self.assertIs(type(second), V110Accessor)
+        self.assertIsNone(first._successor, "First and cached lookups should return alike accessors")
+        self.assertIsNone(second._successor)
+
+    def test_get_registry_service_reuses_instance(self):
+        service = get_registry_service(MOCK_REGISTRY_V110)
+        self.assertIs(get_registry_service(MOCK_REGISTRY_V110), service)
+        self.assertIs(service.get_registry_data(), MOCK_REGISTRY_V110)
+        other = dict(MOCK_REGISTRY_V110)
+        self.assertIsNot(get_registry_service(other), service)
+
+    def test_get_registry_service_sees_packages_added_in_place(self):
+        registry = json.loads(json.dumps(MOCK_REGISTRY_V110))
+        self.assertFalse(get_registry_service(registry).package_exists("late_pkg"))
+        registry["repositories"][0]["packages"].append({"name": "late_pkg", "versions": [{"version": "1.0.0"}]})
+        self.assertTrue(get_registry_service(registry).package_exists("late_pkg"))
+
 if __name__ == "__main__":
     unittest.main()
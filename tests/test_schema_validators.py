@@ -4,8 +4,12 @@ This module tests the abstract base classes and interfaces that form
 the foundation of the Chain of Responsibility and Strategy patterns.
 """
 
+import tempfile
 import unittest
 from pathlib import Path
+from unittest import mock
+
+import jsonschema
 from typing import Dict, List, Tuple
 
 # Add parent directory to path for imports
@@ -106,6 +110,21 @@ class TestValidationContext(unittest.TestCase):
         # Test default value
         self.assertEqual(context.get_data("nonexistent_key", "default"), "default")
         self.assertIsNone(context.get_data("nonexistent_key"))
+    
+    def test_package_file_status(self):
+        """Test file status lookups through the package directory index."""
+        with tempfile.TemporaryDirectory() as tmp:
+            package_dir = Path(tmp)
+            (package_dir / "server.py").write_text("")
+            (package_dir / "sub").mkdir()
+            (package_dir / "sub" / "nested.py").write_text("")
+            context = ValidationContext(package_dir=package_dir)
+            
+            self.assertIn("server.py", context.dir_index())
+            self.assertEqual(context.package_file_status("server.py"), (True, True))
+            self.assertEqual(context.package_file_status("sub"), (True, False))
+            self.assertEqual(context.package_file_status("sub/nested.py"), (True, True))
+            self.assertEqual(context.package_file_status("missing.py"), (False, False))
 
 
 class TestSchemaValidator(unittest.TestCase):
@@ -146,6 +165,47 @@ class TestSchemaValidator(unittest.TestCase):
         self.assertTrue(validator1.validation_called)
         self.assertTrue(validator2.validation_called)
     
+    def test_get_handler_skips_to_handling_validator(self):
+        """Test that the handler lookup finds the matching validator further down the chain."""
+        validator1 = ConcreteValidator("1.2.0")
+        validator2 = ConcreteValidator("1.1.0")
+        validator3 = ConcreteValidator("1.0.0")
+        validator1.set_next(validator2).set_next(validator3)
+        
+        self.assertIs(validator1.get_handler("1.0.0"), validator3)
+        self.assertIs(validator1.get_handler("1.0.0"), validator3)
+        self.assertIs(validator1.get_handler("1.2.0"), validator1)
+        self.assertIsNone(validator1.get_handler("2.0.0"))
+        
+        # Re-pointing a link further down is seen from the head of the chain
+        validator4 = ConcreteValidator("2.0.0")
+        validator2.set_next(validator4)
+        self.assertIsNone(validator1.get_handler("1.0.0"))
+        self.assertIs(validator1.get_handler("2.0.0"), validator4)
+        validator4.next_validator = validator3
+        self.assertIs(validator1.get_handler("1.0.0"), validator3)
+        
+        # Linking validators of another chain keeps the lookups of this one
+        other = ConcreteValidator("1.2.0")
+        with mock.patch.object(ConcreteValidator, "can_handle", autospec=True,
+                               side_effect=lambda validator, version: version == validator.supported_version) as can_handle:
+            other.set_next(ConcreteValidator("1.1.0"))
+            self.assertIs(validator1.get_handler("1.0.0"), validator3)
+            can_handle.assert_not_called()
+    
+    def test_run_checks_preserves_order(self):
+        """Test that independent checks report results in order, sequentially or in parallel."""
+        validator = ConcreteValidator("1.1.0")
+        checks = [
+            lambda metadata, context: (True, []),
+            lambda metadata, context: (False, ["second failed"]),
+            lambda metadata, context: (True, []),
+        ]
+        expected = [(True, []), (False, ["second failed"]), (True, [])]
+        
+        self.assertEqual(validator.run_checks(checks, {}, ValidationContext()), expected)
+        self.assertEqual(validator.run_checks(checks, {}, ValidationContext(parallel=True)), expected)
+    
     def test_validation_without_delegation(self):
         """Test validation when validator can handle the version directly."""
         validator = ConcreteValidator("1.1.0")
@@ -203,6 +263,21 @@ class TestValidationStrategies(unittest.TestCase):
         with self.assertRaises(TypeError):
             SchemaValidationStrategy()
 
+    def test_schema_strategies_report_unresolvable_references(self):
+        """Test that a schema with an unresolvable $ref fails validation instead of raising."""
+        from hatch_validator.package.v1_1_0 import schema_validation as v1_1_0
+        from hatch_validator.package.v1_2_1 import schema_validation as v1_2_1
+        from hatch_validator.package.v1_2_2 import schema_validation as v1_2_2
+        
+        validator = jsonschema.Draft7Validator({"$ref": "#/definitions/missing"})
+        metadata = {"package_schema_version": "1.2.2"}
+        for module in (v1_1_0, v1_2_1, v1_2_2):
+            with self.subTest(module=module.__name__), \
+                    mock.patch.object(module, "get_package_validator", return_value=validator):
+                is_valid, errors = module.SchemaValidation().validate_schema(metadata, ValidationContext())
+                self.assertFalse(is_valid)
+                self.assertEqual(len(errors), 1)
+
 
 class TestValidatorFactory(unittest.TestCase):
     """Test cases for ValidatorFactory class."""
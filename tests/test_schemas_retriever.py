@@ -1,8 +1,20 @@
 """Integration tests for schemas_retriever with real network calls."""
 
+import contextlib
 import os
+import shutil
+import tempfile
+import threading
+import time
 import unittest
-from hatch_validator.schemas.schemas_retriever import get_package_schema, get_registry_schema
+from datetime import datetime, timezone
+from pathlib import Path
+from unittest import mock
+from urllib3.exceptions import MaxRetryError, NewConnectionError
+from hatch_validator.schemas import schemas_retriever
+from hatch_validator.schemas.schemas_retriever import SchemaRetriever, get_package_schema, get_registry_schema
+from hatch_validator.schemas.schema_cache import SchemaCache
+from hatch_validator.schemas.schema_fetcher import SchemaFetcher, MAX_RETRY_AFTER, RELEASES_PER_PAGE, MAX_RELEASE_PAGES
 
 class TestSchemaRetrieverIntegration(unittest.TestCase):
     """Integration tests for schemas_retriever with real network calls."""
@@ -34,5 +46,309 @@ class TestSchemaRetrieverIntegration(unittest.TestCase):
         self.assertIsInstance(schema2, dict, "Schema loaded from cache should be a dict")
         self.assertEqual(schema1["title"], schema2["title"], "Schema loaded from cache should match the forced download")
 
+class TestSchemaCache(unittest.TestCase):
+    """Offline tests for the local schema cache."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.cache = SchemaCache(Path(self._tmp.name))
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_info_round_trip(self):
+        """Test that updated cache info is read back, including after rewrites."""
+        self.assertEqual(self.cache.get_info(), {}, "Missing info file should read as empty info")
+        self.assertTrue(self.cache.update_info({"latest_package_version": "v1.2.0"}))
+        self.assertEqual(self.cache.get_info()["latest_package_version"], "v1.2.0")
+        self.assertTrue(self.cache.update_info({"latest_package_version": "v1.2.2"}))
+        self.assertEqual(self.cache.get_info()["latest_package_version"], "v1.2.2")
+        self.assertEqual(self.cache.get_latest_version("package"), "v1.2.2")
+        
+        self.cache.get_info()["latest_package_version"] = "v9.9.9"
+        self.assertEqual(self.cache.get_latest_version("package"), "v1.2.2", "Returned info should be a copy")
+        self.assertEqual(self.cache.get_info()["latest_package_version"], "v1.2.2")
+
+    def test_freshness(self):
+        """Test freshness from the epoch timestamp, and from the ISO timestamp of older cache info."""
+        self.assertFalse(self.cache.is_fresh(), "Missing info should not be fresh")
+        self.cache.update_info({"updated_at": "2000-01-01T00:00:00+00:00", "updated_at_epoch": time.time()})
+        self.assertTrue(self.cache.is_fresh(), "Epoch timestamp should take precedence")
+        self.cache.update_info({"updated_at_epoch": time.time() - 7200})
+        self.assertFalse(self.cache.is_fresh(max_age=3600))
+        self.cache.update_info({"updated_at": datetime.now(timezone.utc).isoformat()})
+        self.assertTrue(self.cache.is_fresh(), "Legacy ISO timestamp should still be understood")
+
+    def test_schema_round_trip(self):
+        """Test that saved schemas load back, and that re-saving replaces the loaded copy."""
+        self.assertIsNone(self.cache.load_schema("package", "v1.2.0"))
+        self.assertTrue(self.cache.save_schema("package", {"title": "first"}, "v1.2.0"))
+        self.assertEqual(self.cache.load_schema("package", "1.2.0"), {"title": "first"})
+        self.assertTrue(self.cache.save_schema("package", {"title": "second"}, "v1.2.0"))
+        self.assertEqual(self.cache.load_schema("package", "v1.2.0"), {"title": "second"})
+        self.assertTrue(self.cache.has_schema("package", "v1.2.0"))
+        self.assertFalse(self.cache.has_schema("package", "v9.9.9"))
+        self.assertTrue(self.cache.copy_schema("package", "v1.2.0"))
+        self.assertEqual(self.cache.load_schema("package"), {"title": "second"})
+        with mock.patch("hatch_validator.schemas.schema_cache.os.link", side_effect=OSError("not supported")):
+            self.assertTrue(self.cache.copy_schema("package", "v1.2.0"), "Copy should fall back when hard links fail")
+        self.assertEqual(self.cache.get_schema_path("package").read_bytes(),
+                         self.cache.get_schema_path("package", "v1.2.0").read_bytes())
+        with mock.patch("hatch_validator.schemas.schema_cache.os.replace", side_effect=OSError("busy")):
+            self.assertFalse(self.cache.save_schema("package", {"title": "failed"}, "v1.2.0"))
+            self.assertFalse(self.cache.copy_schema("package", "v1.2.0"))
+        self.assertEqual(list(Path(self._tmp.name).rglob("*.tmp")), [], "Failed writes should not leave temporary files")
+        
+        schema = {"title": "third", "required": ["name"]}
+        self.assertTrue(self.cache.save_schema("package", schema, "v1.2.2"))
+        with mock.patch.object(Path, "read_bytes") as read_bytes:
+            loaded = self.cache.load_schema("package", "v1.2.2")
+        read_bytes.assert_not_called()
+        self.assertEqual(loaded, schema, "Saved schema should be served from memory")
+        loaded["required"].append("version")
+        schema["title"] = "changed"
+        self.assertEqual(self.cache.load_schema("package", "v1.2.2"), {"title": "third", "required": ["name"]},
+                         "Schemas kept in memory should not be shared with callers")
+        schema["title"] = "third"
+        
+        with mock.patch.object(Path, "mkdir") as mkdir:
+            self.cache.get_schema_path("package", "v1.2.2")
+        mkdir.assert_not_called()
+        
+        shutil.rmtree(self.cache.cache_dir / "package")
+        self.assertTrue(self.cache.save_schema("package", schema, "v1.2.2"), "Removed directories should be created again")
+        
+        self.cache.invalidate()
+        loaded = self.cache.load_schema("package", "v1.2.2")
+        self.assertEqual(loaded, schema)
+        self.assertIsNot(loaded, schema, "Invalidated schemas should be read again")
+
+    def test_corrupted_schema_detected(self):
+        """Test that a cached schema not matching its recorded digest is rejected."""
+        self.assertTrue(self.cache.save_schema("package", {"title": "cached"}, "v1.2.0"))
+        digest = self.cache.get_schema_digest("package", "v1.2.0")
+        self.cache.update_info({"package": dict(digest, version="v1.2.0")})
+        self.assertTrue(self.cache.has_schema("package", "v1.2.0"))
+        
+        path = self.cache.get_schema_path("package", "v1.2.0")
+        path.write_bytes(path.read_bytes()[:-2])
+        self.assertFalse(self.cache.has_schema("package", "v1.2.0"), "Truncated schema should not be reported as cached")
+        path.write_bytes(path.read_bytes().replace(b"cached", b"broken") + b"}\n")
+        self.assertIsNone(self.cache.load_schema("package", "v1.2.0"), "Modified schema should not be loaded")
+
+    def test_not_modified_releases_refresh_info(self):
+        """Test that a 304 on the releases keeps the cached schemas and refreshes the timestamp."""
+        retriever = SchemaRetriever(Path(self._tmp.name))
+        retriever.cache.save_schema("package", {"title": "cached"})
+        retriever.cache.update_info({
+            "updated_at": "2000-01-01T00:00:00+00:00",
+            "package": {"version": "v1.2.0"},
+            "etag": '"abc"',
+        })
+        response = mock.Mock(status_code=304)
+        with mock.patch.object(retriever.fetcher._session, "get", return_value=response) as get:
+            self.assertFalse(retriever.update_schemas())
+        self.assertEqual(get.call_args.kwargs["headers"]["If-None-Match"], '"abc"')
+        self.assertNotIn("If-Modified-Since", get.call_args.kwargs["headers"])
+        self.assertTrue(retriever.cache.is_fresh())
+        self.assertEqual(retriever.cache.get_info()["etag"], '"abc"')
+        self.assertEqual(retriever.cache.load_schema("package"), {"title": "cached"})
+
+    def test_update_check_cooldown(self):
+        """Test that repeated non-forced updates only reach GitHub once within the cooldown, even after a failed check."""
+        retriever = SchemaRetriever(Path(self._tmp.name))
+        with mock.patch.object(retriever.fetcher, "get_releases", return_value=[]) as get_releases:
+            retriever.update_schemas()
+            retriever.update_schemas()
+            self.assertEqual(get_releases.call_count, 1)
+            retriever.update_schemas(force=True)
+            self.assertEqual(get_releases.call_count, 2, "Forced updates should ignore the cooldown")
+
+    def test_update_pages_through_releases(self):
+        """Test that older release pages are only fetched while a schema type is missing."""
+        retriever = SchemaRetriever(Path(self._tmp.name))
+        first_page = [{"tag_name": "schemas-package-v1.2.2"}] + [{"tag_name": f"v{i}"} for i in range(RELEASES_PER_PAGE - 1)]
+        pages = {1: first_page, 2: [{"tag_name": "schemas-registry-v1.1.0"}]}
+        with mock.patch.object(retriever.fetcher, "get_releases",
+                               side_effect=lambda page=1, **validators: pages[page]) as get_releases, \
+             mock.patch.object(retriever.fetcher, "download_schema_content_if_modified",
+                               return_value=(True, b'{"title": "schema"}', None)):
+            self.assertTrue(retriever.update_schemas(force=True))
+        self.assertEqual(get_releases.call_count, 2)
+        self.assertEqual(retriever.cache.get_latest_version("registry"), "v1.1.0")
+        
+        with mock.patch.object(retriever.fetcher, "get_releases", return_value=first_page) as get_releases, \
+             mock.patch.object(retriever.fetcher, "download_schema_content_if_modified",
+                               return_value=(True, b'{"title": "schema"}', None)), \
+             self.assertLogs("hatch.schema_retriever", "WARNING"):
+            retriever.update_schemas(force=True)
+        self.assertEqual(get_releases.call_count, MAX_RELEASE_PAGES, "Paging should stop at the page limit")
+
+    def test_update_skipped_after_concurrent_refresh(self):
+        """Test that an update waiting on the cache lock is skipped if another process refreshed the cache."""
+        retriever = SchemaRetriever(Path(self._tmp.name))
+        real_lock = retriever.cache.update_lock
+        
+        @contextlib.contextmanager
+        def lock_after_refresh():
+            with real_lock():
+                # Simulates another process finishing an update while this one waited
+                retriever.cache.update_info({"updated_at_epoch": time.time()})
+                yield
+        
+        with mock.patch.object(retriever.cache, "update_lock", lock_after_refresh), \
+             mock.patch.object(retriever.fetcher, "get_releases") as get_releases:
+            self.assertFalse(retriever.update_schemas(force=True))
+        get_releases.assert_not_called()
+        self.assertTrue((Path(self._tmp.name) / ".update.lock").exists())
+
+    def test_update_downloads_all_schema_types(self):
+        """Test that an update downloads and caches every schema type found in the releases."""
+        retriever = SchemaRetriever(Path(self._tmp.name))
+        releases = [
+            {"tag_name": "schemas-registry-v1.1.0"},
+            {"tag_name": "schemas-package-v1.2.2"},
+        ]
+        schemas = {"hatch_pkg_metadata_schema.json": b'{\n  "title": "package"\n}',
+                   "hatch_all_pkg_metadata_schema.json": b'{"title": "registry"}'}
+        with mock.patch.object(retriever.fetcher, "get_releases", return_value=releases), \
+             mock.patch.object(retriever.fetcher, "download_schema_content_if_modified",
+                               side_effect=lambda url, etag: (True, schemas[url.rsplit("/", 1)[1]], '"etag"')):
+            self.assertTrue(retriever.update_schemas(force=True))
+        
+        self.assertEqual(retriever.cache.load_schema("package", "v1.2.2"), {"title": "package"})
+        self.assertEqual(retriever.cache.load_schema("registry"), {"title": "registry"})
+        self.assertEqual(retriever.cache.get_schema_path("package").read_bytes(),
+                         schemas["hatch_pkg_metadata_schema.json"], "Downloads should be cached as received")
+        self.assertEqual(retriever.cache.get_latest_version("registry"), "v1.1.0")
+        self.assertIn("sha256", retriever.cache.get_info()["package"])
+        
+        # Unchanged verified schemas are not requested again
+        with mock.patch.object(retriever.fetcher, "get_releases", return_value=releases), \
+             mock.patch.object(retriever.fetcher._session, "get") as get:
+            self.assertFalse(retriever.update_schemas(force=True))
+        get.assert_not_called()
+        self.assertEqual(retriever.cache.get_info()["registry"]["etag"], '"etag"')
+        
+        # Without a recorded size, unchanged schemas are requested conditionally and kept as cached
+        info = retriever.cache.get_info()
+        retriever.cache.update_info(dict(info, package={k: v for k, v in info["package"].items() if k != "size"}))
+        not_modified = mock.Mock(status_code=304)
+        with mock.patch.object(retriever.fetcher, "get_releases", return_value=releases), \
+             mock.patch.object(retriever.fetcher._session, "get", return_value=not_modified) as get:
+            self.assertFalse(retriever.update_schemas(force=True))
+        get.assert_called_once()
+        self.assertEqual(get.call_args.kwargs["headers"], {"If-None-Match": '"etag"'})
+        self.assertEqual(retriever.cache.load_schema("package"), {"title": "package"})
+
+    def test_get_schemas_downloads_missing_versions(self):
+        """Test that bulk lookups serve cached versions and download only the missing ones."""
+        retriever = SchemaRetriever(Path(self._tmp.name))
+        retriever.cache.save_schema("package", {"title": "cached"}, "v1.2.0")
+        with mock.patch.object(retriever.fetcher, "download_specific_version_content",
+                               side_effect=lambda schema_type, version: f'{{"title": "{schema_type} {version}"}}'.encode()) as download:
+            schemas = retriever.get_schemas([("package", "1.2.0"), ("package", "1.2.1"), ("registry", "v1.1.0")])
+        
+        self.assertEqual(schemas[("package", "1.2.0")], {"title": "cached"})
+        self.assertEqual(schemas[("package", "1.2.1")], {"title": "package 1.2.1"})
+        self.assertEqual(schemas[("registry", "v1.1.0")], {"title": "registry v1.1.0"})
+        self.assertEqual(download.call_count, 2)
+        self.assertEqual(retriever.cache.load_schema("package", "v1.2.1"), {"title": "package 1.2.1"})
+
+    def test_concurrent_lookups_share_download(self):
+        """Test that concurrent lookups of the same missing schema download it once."""
+        retriever = SchemaRetriever(Path(self._tmp.name))
+        started = threading.Event()
+        release = threading.Event()
+        
+        def slow_download(schema_type, version):
+            started.set()
+            release.wait(5)
+            return f'{{"title": "{version}"}}'.encode()
+        
+        with mock.patch.object(retriever.fetcher, "download_specific_version_content", side_effect=slow_download) as download:
+            results = []
+            threads = [threading.Thread(target=lambda: results.append(retriever.get_schema("package", "1.2.1")))
+                       for _ in range(3)]
+            threads[0].start()
+            started.wait(5)
+            for thread in threads[1:]:
+                thread.start()
+            release.set()
+            for thread in threads:
+                thread.join(5)
+        
+        self.assertEqual(download.call_count, 1)
+        self.assertEqual(results, [{"title": "1.2.1"}] * 3)
+
+class TestSchemaFetcher(unittest.TestCase):
+    """Offline tests for the schema fetcher."""
+
+    def test_retry_after_is_bounded(self):
+        """Test that retries are given up when the server asks to wait too long."""
+        retry = SchemaFetcher()._session.get_adapter("https://api.github.com").max_retries
+        long_wait = mock.Mock(status=429, headers={"Retry-After": str(MAX_RETRY_AFTER + 1)})
+        short_wait = mock.Mock(status=429, headers={"Retry-After": "2"})
+        short_wait.get_redirect_location.return_value = False
+        with self.assertRaises(MaxRetryError):
+            retry.increment("GET", "/releases", response=long_wait)
+        self.assertEqual(retry.increment("GET", "/releases", response=short_wait).status, retry.status - 1)
+        self.assertIn(429, retry.status_forcelist)
+        self.assertFalse(retry.raise_on_status)
+
+    def test_connection_errors_not_retried(self):
+        """Test that only retry statuses are retried, not unreachable hosts."""
+        retry = SchemaFetcher()._session.get_adapter("https://api.github.com").max_retries
+        with self.assertRaises(MaxRetryError):
+            retry.increment("GET", "/releases", error=NewConnectionError(None, "unreachable"))
+
+    def test_api_requests_use_github_token(self):
+        """Test that the releases request is authenticated when GITHUB_TOKEN is set."""
+        with mock.patch.dict(os.environ, {"GITHUB_TOKEN": "secret"}):
+            fetcher = SchemaFetcher()
+        response = mock.Mock(status_code=200, content=b"[]", headers={})
+        with mock.patch.object(fetcher._session, "get", return_value=response) as get:
+            self.assertEqual(fetcher.get_releases(), [])
+        headers = get.call_args.kwargs["headers"]
+        self.assertEqual(headers["Authorization"], "Bearer secret")
+        self.assertEqual(headers["Accept"], "application/vnd.github+json")
+
+    def test_releases_skipped_while_rate_limited(self):
+        """Test that releases are not requested again before an exhausted rate limit resets."""
+        fetcher = SchemaFetcher()
+        exhausted = mock.Mock(status_code=200, content=b"[]",
+                              headers={"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": str(time.time() + 600)})
+        with mock.patch.object(fetcher._session, "get", return_value=exhausted) as get:
+            fetcher.get_releases()
+            self.assertEqual(fetcher.get_releases(), [])
+        get.assert_called_once()
+
+    def test_context_manager_closes_session(self):
+        """Test that leaving the fetcher context closes its session."""
+        fetcher = SchemaFetcher()
+        with mock.patch.object(fetcher._session, "close") as close:
+            with fetcher as entered:
+                self.assertIs(entered, fetcher)
+                close.assert_not_called()
+            close.assert_called_once()
+
+class TestSchemaHelpers(unittest.TestCase):
+    """Offline tests for the module level schema helpers."""
+
+    def test_package_validator_built_once(self):
+        """Test that the compiled package schema validator is reused across lookups."""
+        schema = {"type": "object", "required": ["name"]}
+        with mock.patch.object(schemas_retriever.schema_retriever, "get_schema", return_value=schema) as get_schema, \
+             mock.patch.dict(schemas_retriever._schema_memo, clear=True), \
+             mock.patch.dict(schemas_retriever._validator_memo, clear=True):
+            validator = schemas_retriever.get_package_validator("9.9.9")
+            self.assertIs(schemas_retriever.get_package_validator("9.9.9"), validator)
+            get_schema.assert_called_once()
+            schemas_retriever.clear_schema_cache()
+            self.assertIsNot(schemas_retriever.get_package_validator("9.9.9"), validator)
+            self.assertEqual(get_schema.call_count, 2, "Cleared schemas should be retrieved again")
+        self.assertTrue(validator.is_valid({"name": "pkg"}))
+        self.assertFalse(validator.is_valid({}))
+
 if __name__ == "__main__":
     unittest.main()
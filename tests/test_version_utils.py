@@ -51,6 +51,14 @@ class TestVersionConstraintValidator(unittest.TestCase):
                 self.assertFalse(valid, f"Version '{ver}' should be invalid")
                 self.assertIsNotNone(error, f"Invalid version '{ver}' should have error message")
     
+    def test_parse_version(self):
+        """Test that versions parse for ordering, and invalid ones to None."""
+        self.assertGreater(VersionConstraintValidator.parse_version("1.10.0"),
+                           VersionConstraintValidator.parse_version("1.9.0"))
+        for ver in ("", None, "invalid"):
+            with self.subTest(version=ver):
+                self.assertIsNone(VersionConstraintValidator.parse_version(ver))
+    
     def test_validate_constraint_valid_cases(self):
         """Test validation of valid constraint strings."""
         valid_constraints = [